@@ -7,28 +7,346 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from datetime import time as _time
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Final, NamedTuple
 
 from src.error_handling import handle_api_error
 
-try:  # Prefer scipy for accuracy
-    from scipy.stats import norm  # type: ignore
-except Exception:  # Fallback minimal normal cdf/pdf implementation
-    class _NormApprox:
-        @staticmethod
-        def cdf(x: float) -> float:
-            # Abramowitz-Stegun approximation via error function
-            import math
-            return 0.5 * (1.0 + math.erf(x / math.sqrt(2)))
-        @staticmethod
-        def pdf(x: float) -> float:
-            import math
-            return (1.0 / math.sqrt(2 * math.pi)) * math.exp(-0.5 * x * x)
-    norm = _NormApprox()  # type: ignore
-
+# Optional: vectorized (chain-level) pricing needs NumPy; SciPy's ndtr is the
+# preferred array normal CDF when present.
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+try:
+    from scipy.special import ndtr as _ndtr  # type: ignore
+except Exception:
+    _ndtr = None
+# Optional: SciPy's brentq for the IV bracketing fallback (in-module port otherwise).
+try:
+    from scipy.optimize import brentq as _scipy_brentq  # type: ignore
+except Exception:
+    _scipy_brentq = None
+# Optional: Numba JIT for the scalar kernels, imported on first use (see _kernels).
 logger = logging.getLogger(__name__)
 
+
+# Normal CDF/PDF via math.erf / math.exp: Phi(x) = 0.5 + 0.5*erf(x/sqrt(2)),
+# phi(x) = exp(-x^2/2)/sqrt(2*pi); cheaper than scipy.stats.norm's dispatcher.
+# Constants are module-level finals so hot paths never recompute them per call.
+_INV_SQRT_2: Final = 0.7071067811865476  # 1/sqrt(2)
+_INV_SQRT_2PI: Final = 0.3989422804014327  # 1/sqrt(2*pi)
+_DAYS_PER_YEAR: Final = 365.0
+_INV_DAYS_PER_YEAR: Final = 1.0 / _DAYS_PER_YEAR
+_SECONDS_PER_YEAR: Final = _DAYS_PER_YEAR * 24.0 * 3600.0
+_EPOCH_ORDINAL: Final = date(1970, 1, 1).toordinal()
+_EXPIRY_SECONDS_OF_DAY: Final = 15.5 * 3600.0  # date-only expiries settle at 15:30 UTC
+
+_erf_vec = np.vectorize(math.erf, otypes=[float]) if np is not None else None
+
+
+def _norm_cdf_vec(x: Any) -> Any:
+    """Elementwise normal CDF for when SciPy is unavailable."""
+    return 0.5 + 0.5 * _erf_vec(x * _INV_SQRT_2)
+
+
+class Greeks(NamedTuple):
+    """Black-Scholes price and greeks (theta per day, vega/rho per 1% move).
+
+    A tuple rather than a dict: one allocation per result and immutable, so
+    cached results can be handed out directly. Keeps the former dict's
+    read API - result["price"], .get(), .keys(), .items() - for callers.
+    """
+    price: float
+    delta: float
+    gamma: float
+    theta: float
+    vega: float
+    rho: float
+
+    def __getitem__(self, key):  # type: ignore[override]
+        # str keys behave like the old dict; ints/slices keep tuple semantics
+        if type(key) is str:
+            if key in Greeks._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in Greeks._fields else default
+
+    def keys(self) -> tuple[str, ...]:
+        return Greeks._fields
+
+    def items(self) -> zip:
+        return zip(Greeks._fields, self, strict=True)
+
+
+_ZERO_GREEKS: Final = Greeks(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+@dataclass(slots=True)
+class GreeksChain:
+    """Column-oriented (SoA) Greeks for a whole chain: one float64 array per field.
+
+    Chain-level reductions (e.g. net delta = ``chain.delta.sum()``) are single
+    array passes, and the columns feed pandas without per-row conversion.
+    ``chain["delta"]`` returns a column; ``chain[i]`` returns row i as Greeks.
+    """
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+
+    @classmethod
+    def from_scalar_list(cls, rows: Iterable[Greeks | Mapping[str, float]]) -> GreeksChain:
+        """Transpose per-strike results (Greeks or legacy dicts) into columns."""
+        if np is None:
+            raise RuntimeError("GreeksChain requires numpy")
+        fields = Greeks._fields
+        table = np.array([[row[f] for f in fields] for row in rows], dtype=float).reshape(-1, len(fields))
+        return cls(*(np.ascontiguousarray(col) for col in table.T))
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def __getitem__(self, key: int | str) -> Any:
+        if type(key) is str:
+            if key in Greeks._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return Greeks(*(float(getattr(self, f)[key]) for f in Greeks._fields))
+
+
+def _precompute(S: float, K: float, T: float, r: float, q: float) -> tuple[float, float, float, float]:
+    """Sigma-independent terms (sqrt_t, log_fk, disc_r, disc_q) of Black-Scholes.
+
+    log_fk = ln(F/K) = ln(S/K) + (r - q)T. The IV solver computes these once
+    per solve and reuses them on every Newton step.
+    """
+    return math.sqrt(T), math.log(S / K) + (r - q) * T, math.exp(-r * T), math.exp(-q * T)
+
+
+def _bs_given_precomputed(
+    is_call: bool, S: float, K: float, sigma: float, sqrt_t: float, log_fk: float, disc_r: float, disc_q: float
+) -> tuple[float, float]:
+    """Black-Scholes price and vega (per 1.0 vol) from `_precompute` terms."""
+    vsqrt_t = sigma * sqrt_t
+    d1 = (log_fk + 0.5 * vsqrt_t * vsqrt_t) / vsqrt_t
+    d2 = d1 - vsqrt_t
+    w = 1.0 if is_call else -1.0
+    s_disc = S * disc_q
+    price = w * (s_disc * (0.5 + 0.5 * w * math.erf(d1 * _INV_SQRT_2))
+                 - K * disc_r * (0.5 + 0.5 * w * math.erf(d2 * _INV_SQRT_2)))
+    vega = s_disc * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI * sqrt_t
+    return price, vega
+
+
+def _bs_kernel(
+    is_call: bool, S: float, K: float, T: float, sigma: float, r: float, q: float
+) -> tuple[float, float, float, float, float, float]:
+    """Black-Scholes price and greeks as (price, delta, gamma, theta, vega, rho).
+
+    Pure math on validated inputs (S, K, T, sigma > 0) so it can be JIT-compiled
+    by Numba when available; theta is per day and vega/rho per 1% move.
+    """
+    # Discount factors, sqrt(T) and ln(F/K) once (the `_precompute` terms, inlined
+    # so the kernel compiles standalone); every term below reuses them
+    sqrt_t = math.sqrt(T)
+    log_fk = math.log(S / K) + (r - q) * T
+    disc_r = math.exp(-r * T)
+    disc_q = math.exp(-q * T)
+    vsqrt_t = sigma * sqrt_t
+    d1 = (log_fk + 0.5 * vsqrt_t * vsqrt_t) / vsqrt_t
+    d2 = d1 - vsqrt_t
+    erf_d1 = math.erf(d1 * _INV_SQRT_2)
+    erf_d2 = math.erf(d2 * _INV_SQRT_2)
+    pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    s_disc = S * disc_q
+    k_disc = K * disc_r
+
+    # Branchless call/put: w = +1 (call) / -1 (put); N(-x) = 1 - N(x)
+    w = 1.0 if is_call else -1.0
+    nwd1 = 0.5 + 0.5 * w * erf_d1
+    nwd2 = 0.5 + 0.5 * w * erf_d2
+
+    price = w * (s_disc * nwd1 - k_disc * nwd2)
+    delta = w * disc_q * nwd1
+    gamma = disc_q * pdf_d1 / (S * vsqrt_t)
+    theta_days = -(s_disc * sigma * pdf_d1) / (2.0 * sqrt_t) - w * (r * k_disc * nwd2 - q * s_disc * nwd1)
+    theta = theta_days * _INV_DAYS_PER_YEAR
+    vega = s_disc * pdf_d1 * sqrt_t / 100.0
+    rho = w * k_disc * T * nwd2 / 100.0
+    return price, delta, gamma, theta, vega, rho
+
+
+class _Kernels(NamedTuple):
+    bs_kernel: Any
+    bs_given_precomputed: Any
+
+
+_KERNELS: _Kernels | None = None
+
+
+def _kernels() -> _Kernels:
+    """The pricing kernels, Numba-compiled on first use when Numba is installed.
+
+    Importing numba and compiling (or loading the JIT cache) happens here rather
+    than at module import, so importers that never price an option don't pay
+    for it. Falls back to the pure-Python functions if Numba is missing or fails.
+    """
+    global _KERNELS
+    kernels = _KERNELS
+    if kernels is None:
+        kernels = _Kernels(_bs_kernel, _bs_given_precomputed)
+        try:
+            jit = import_module("numba").njit(cache=True, error_model="numpy")
+            compiled = _Kernels(jit(_bs_kernel), jit(_bs_given_precomputed))
+            # compile (or load the cache) now so a failure falls back here, not mid-solve
+            compiled.bs_kernel(True, 100.0, 100.0, 1.0, 0.2, 0.05, 0.0)
+            compiled.bs_given_precomputed(True, 100.0, 100.0, 0.2, 1.0, 0.05, 0.95, 1.0)
+            kernels = compiled
+        except Exception as e:  # keep the pure-Python kernels
+            logger.debug("Numba JIT unavailable for Black-Scholes kernel: %s", e)
+        _KERNELS = kernels
+    return kernels
+
+
+_BRENT_RTOL: Final = 4.0 * 2.220446049250313e-16  # brentq default: 4 * machine eps
+
+
+def _brentq(f: Any, a: float, b: float, xtol: float, maxiter: int) -> tuple[float, int]:
+    """Brent's method root of f on a sign-changing bracket [a, b] -> (root, iterations).
+
+    Uses scipy.optimize.brentq when SciPy is installed; otherwise a direct port
+    of its algorithm (inverse quadratic / secant steps guarded by bisection).
+    Raises ValueError when f(a) and f(b) share a sign.
+    """
+    if _scipy_brentq is not None:
+        root, res = _scipy_brentq(f, a, b, xtol=xtol, maxiter=maxiter, full_output=True, disp=False)
+        return root, res.iterations
+    xpre, xcur = a, b
+    fpre, fcur = f(xpre), f(xcur)
+    if fpre * fcur > 0:
+        raise ValueError("f(a) and f(b) must have different signs")
+    if fpre == 0:
+        return xpre, 0
+    if fcur == 0:
+        return xcur, 0
+    xblk = fblk = spre = scur = 0.0
+    for i in range(maxiter):
+        if fpre * fcur < 0:
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+        tol = 0.5 * (xtol + _BRENT_RTOL * abs(xcur))
+        sbis = 0.5 * (xblk - xcur)
+        if fcur == 0 or abs(sbis) < tol:
+            return xcur, i + 1
+        if abs(spre) > tol and abs(fcur) < abs(fpre):
+            if xpre == xblk:  # secant
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:  # inverse quadratic interpolation
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - tol):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+        xpre, fpre = xcur, fcur
+        xcur += scur if abs(scur) > tol else (tol if sbis > 0 else -tol)
+        fcur = f(xcur)
+    return xcur, maxiter
+
+
+def _iv_brent(
+    is_call: bool,
+    S: float,
+    K: float,
+    market_price: float,
+    sqrt_t: float,
+    log_fk: float,
+    disc_r: float,
+    disc_q: float,
+    min_iv: float,
+    max_iv: float,
+    precision: float,
+    budget: int,
+) -> tuple[float, int]:
+    """Bracketed Brent IV on [min_iv, max_iv] from `_precompute` terms -> (sigma, iterations).
+
+    Fallback for the Newton solvers once vega goes flat or a step pins at a
+    bound. With no sign change the target lies outside the bounds and the
+    nearer bound is returned after 0 iterations.
+    """
+    bs_given_precomputed = _kernels().bs_given_precomputed
+
+    def objective(s: float) -> float:
+        return bs_given_precomputed(is_call, S, K, s, sqrt_t, log_fk, disc_r, disc_q)[0] - market_price
+
+    try:
+        return _brentq(objective, min_iv, max_iv, precision, budget)
+    except ValueError:
+        return (min_iv if objective(min_iv) > 0 else max_iv), 0
+
+
+# Decimal places inputs are rounded to before the cache lookup, so near-identical
+# requests (repeated chain snapshots, consecutive IV steps) share one entry.
+_BS_CACHE_DECIMALS = 10
+
+
+@lru_cache(maxsize=4096)
+def _bs_core(
+    is_call: bool, S: float, K: float, T: float, sigma: float, r: float, q: float
+) -> tuple[float, float, float, float, float, float]:
+    """Memoised `_bs_kernel` as Greeks; callers pass rounded, hashable floats."""
+    return Greeks(*_kernels().bs_kernel(is_call, S, K, T, sigma, r, q))
+
+
+def _compute_dte(expiry_date: date | datetime, current_date: date | datetime) -> float:
+    """Years from current_date to expiry_date (see OptionGreeks._calculate_dte)."""
+    # Coerce provided current_date to datetime
+    if isinstance(current_date, datetime):
+        # If provided datetime is naive, assume UTC to avoid timezone-mismatch
+        now_dt = current_date if (current_date.tzinfo is not None) else current_date.replace(tzinfo=UTC)
+    else:
+        # Treat provided date as "now" at current local time (best effort)
+        # If caller provided only date, default to start of day to avoid negative durations
+        now_dt = datetime.combine(current_date, _time(0, 0, 0)).replace(tzinfo=UTC)
+
+    # Coerce expiry input to a concrete datetime
+    if isinstance(expiry_date, datetime):
+        exp_dt = expiry_date
+    else:
+        # Assume market expiry at 15:30 UTC for date-only inputs to keep timezone-aware arithmetic
+        exp_dt = datetime.combine(expiry_date, _time(15, 30, 0)).replace(tzinfo=UTC)
+
+    # Compute fractional years, clamp at 0
+    seconds = (exp_dt - now_dt).total_seconds()
+    if seconds <= 0:
+        return 0.0
+    return seconds / _SECONDS_PER_YEAR
+
+
+# A chain evaluation prices every strike against the same (expiry, as-of) pair;
+# memoise on the raw, hashable inputs so repeats skip combine/tz/timedelta work.
+# date and datetime never compare equal, so the two conventions cannot collide.
+# The result depends only on the inputs (not on any OptionGreeks instance flags).
+_cached_dte = lru_cache(maxsize=1024)(_compute_dte)
+
+
 class OptionGreeks:
     """Calculate option theoretical prices and greeks."""
 
@@ -49,33 +367,44 @@ class OptionGreeks:
         expire at 15:30 local time on that day (Indian markets convention). For a
         datetime input, it is used as-is.
         """
-        # Current timestamp (timezone-aware, UTC) by default to avoid naive datetimes
-        now_dt = None
+        # Fast path for the common date/date pair: integer ordinal difference, no
+        # combine/tz work. `type() is date` since datetime subclasses date and
+        # must take the general branch. Same 15:30 UTC settlement convention.
+        if type(expiry_date) is date and type(current_date) is date:
+            seconds = (expiry_date.toordinal() - current_date.toordinal()) * 86400.0 + _EXPIRY_SECONDS_OF_DAY
+            return seconds / _SECONDS_PER_YEAR if seconds > 0 else 0.0
         if current_date is None:
-            # Use UTC now to ensure timezone awareness in calculations
-            now_dt = datetime.now(UTC)
-        else:
-            # Coerce provided current_date to datetime
-            if isinstance(current_date, datetime):
-                # If provided datetime is naive, assume UTC to avoid timezone-mismatch
-                now_dt = current_date if (current_date.tzinfo is not None) else current_date.replace(tzinfo=UTC)
-            else:
-                # Treat provided date as "now" at current local time (best effort)
-                # If caller provided only date, default to start of day to avoid negative durations
-                now_dt = datetime.combine(current_date, _time(0, 0, 0)).replace(tzinfo=UTC)
+            # Use UTC now to ensure timezone awareness in calculations (never cached)
+            return _compute_dte(expiry_date, datetime.now(UTC))
+        return _cached_dte(expiry_date, current_date)
 
-        # Coerce expiry input to a concrete datetime
-        if isinstance(expiry_date, datetime):
-            exp_dt = expiry_date
-        else:
-            # Assume market expiry at 15:30 UTC for date-only inputs to keep timezone-aware arithmetic
-            exp_dt = datetime.combine(expiry_date, _time(15, 30, 0)).replace(tzinfo=UTC)
+    @staticmethod
+    def _calculate_dte_vec(
+        expiries: Iterable[date | datetime], current_date: date | datetime | None = None
+    ) -> Any:
+        """`_calculate_dte` over many expiries at once, as an ndarray of years.
+
+        Plain dates (the common chain case) go through one ordinal array
+        subtraction; any datetime expiry falls back to the scalar path so
+        both conventions match `_calculate_dte` exactly.
+        """
+        if np is None:
+            raise RuntimeError("_calculate_dte_vec requires numpy")
+        expiries = list(expiries)
+        if current_date is None:
+            current_date = datetime.now(UTC)
+        if any(isinstance(e, datetime) for e in expiries):
+            return np.array([OptionGreeks._calculate_dte(e, current_date) for e in expiries], dtype=float)
 
-        # Compute fractional years, clamp at 0
-        seconds = (exp_dt - now_dt).total_seconds()
-        if seconds <= 0:
-            return 0.0
-        return seconds / (365.0 * 24.0 * 3600.0)
+        if isinstance(current_date, datetime):
+            now_dt = current_date if current_date.tzinfo is not None else current_date.replace(tzinfo=UTC)
+            now_s = now_dt.timestamp()
+        else:
+            now_s = (current_date.toordinal() - _EPOCH_ORDINAL) * 86400.0
+        ordinals = np.fromiter((e.toordinal() for e in expiries), dtype=np.int64, count=len(expiries))
+        # Date expiries settle at 15:30 UTC (see _compute_dte)
+        seconds = (ordinals - _EPOCH_ORDINAL) * 86400.0 + _EXPIRY_SECONDS_OF_DAY - now_s
+        return np.maximum(seconds, 0.0) / _SECONDS_PER_YEAR
 
     def black_scholes(
         self,
@@ -87,7 +416,7 @@ class OptionGreeks:
         sigma: float = 0.20,  # Implied volatility / historical volatility
         q: float = 0.0,  # Dividend yield
         current_date: date | datetime | None = None
-    ) -> dict[str, float]:
+    ) -> Greeks:
         """
         Calculate option price and greeks using Black-Scholes model.
         
@@ -102,7 +431,7 @@ class OptionGreeks:
             current_date: Current date for DTE calculation if T is a date
             
         Returns:
-            Dict with option price and greeks
+            Greeks (price and greeks; also readable as result["price"] etc.)
         """
         # Handle date inputs for T
         if isinstance(T, (date, datetime)):
@@ -112,78 +441,251 @@ class OptionGreeks:
         if r is None:
             r = self.risk_free_rate
 
-        # Handle edge cases
-        if T <= 0 or sigma <= 0:
-            return self._intrinsic_value(is_call, S, K)
-
         try:
-            # Black-Scholes formula
-            d1 = (math.log(S/K) + (r - q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
-            d2 = d1 - sigma * math.sqrt(T)
+            # Round to the cache resolution before the guards so they see exactly
+            # what the kernel would (a tiny positive T or sigma rounds to 0.0)
+            d = _BS_CACHE_DECIMALS
+            S = round(float(S), d)
+            K = round(float(K), d)
+            T = round(float(T), d)
+            sigma = round(float(sigma), d)
+
+            # Handle edge cases
+            if T <= 0 or sigma <= 0:
+                return self._intrinsic_value(is_call, S, K)
+            if S <= 0 or K <= 0:
+                # Kernel may be JIT-compiled (no math domain errors there); reject explicitly
+                raise ValueError(f"invalid spot/strike: S={S} K={K}")
+            # Greeks is immutable, so the cached instance is returned as-is
+            return _bs_core(bool(is_call), S, K, T, sigma, round(float(r), d), round(float(q), d))
 
-            # Calculate option price
-            if is_call:
-                price = S * math.exp(-q * T) * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
-            else:
-                price = K * math.exp(-r * T) * norm.cdf(-d2) - S * math.exp(-q * T) * norm.cdf(-d1)
+        except Exception as e:
+            # Route analytics calculation error centrally; keep log and fallback
+            handle_api_error(e, component="analytics.option_greeks", context={"fn": "black_scholes"})
+            logger.error("Black-Scholes calculation error: %s", e)
+            return _ZERO_GREEKS
 
-            # Calculate greeks
-            delta = math.exp(-q * T) * norm.cdf(d1) if is_call else math.exp(-q * T) * (norm.cdf(d1) - 1)
+    black_scholes.cache_clear = _bs_core.cache_clear  # type: ignore[attr-defined]
 
-            gamma = math.exp(-q * T) * norm.pdf(d1) / (S * sigma * math.sqrt(T))
+    def black_scholes_vec(
+        self,
+        is_call: Any,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: float | None = None,
+        sigma: Any = 0.20,
+        q: Any = 0.0,
+    ) -> GreeksChain:
+        """
+        Vectorized Black-Scholes over NumPy arrays (e.g. a whole option chain).
 
-            theta_days = -(S * sigma * math.exp(-q * T) * norm.pdf(d1)) / (2 * math.sqrt(T))
-            if is_call:
-                theta_days -= r * K * math.exp(-r * T) * norm.cdf(d2) - q * S * math.exp(-q * T) * norm.cdf(d1)
-            else:
-                theta_days -= r * K * math.exp(-r * T) * norm.cdf(-d2) - q * S * math.exp(-q * T) * norm.cdf(-d1)
+        All array arguments broadcast against each other; `T` is time to expiry
+        in years. d1/d2, N(d1), N(d2), n(d1) and the discount factors are computed
+        once and shared by price and every greek.
 
-            # Convert theta to daily
-            theta = theta_days / 365.0
+        Returns:
+            GreeksChain with one ndarray column per greek (``result["price"]`` still
+            works). Expired or zero-vol entries carry intrinsic values; entries with
+            non-positive S/K are zeroed (mirrors the scalar error fallback).
+        """
+        if np is None:
+            raise RuntimeError("black_scholes_vec requires numpy")
+        if r is None:
+            r = self.risk_free_rate
+        is_call, S, K, T, sigma, q = np.broadcast_arrays(
+            np.asarray(is_call, dtype=bool),
+            np.asarray(S, dtype=float),
+            np.asarray(K, dtype=float),
+            np.asarray(T, dtype=float),
+            np.asarray(sigma, dtype=float),
+            np.asarray(q, dtype=float),
+        )
+        valid = (S > 0) & (K > 0)
+        live = valid & (T > 0) & (sigma > 0)
+        # Substitute harmless values where not live so no warnings/NaNs leak
+        Tl = np.where(live, T, 1.0)
+        sl = np.where(live, sigma, 1.0)
+        Sl = np.where(valid, S, 1.0)
+        Kl = np.where(valid, K, 1.0)
+
+        sqrt_t = np.sqrt(Tl)
+        vsqrt_t = sl * sqrt_t
+        d1 = (np.log(Sl / Kl) + (r - q + 0.5 * sl * sl) * Tl) / vsqrt_t
+        d2 = d1 - vsqrt_t
+        cdf = _ndtr if _ndtr is not None else _norm_cdf_vec
+        # Branchless call/put over mixed chains: w = +1 (call) / -1 (put)
+        w = np.where(is_call, 1.0, -1.0)
+        nwd1 = cdf(w * d1)
+        nwd2 = cdf(w * d2)
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+        disc_q = np.exp(-q * Tl)
+        s_disc = Sl * disc_q
+        k_disc = Kl * np.exp(-r * Tl)
+
+        price = w * (s_disc * nwd1 - k_disc * nwd2)
+        delta = w * disc_q * nwd1
+        gamma = disc_q * pdf_d1 / (Sl * vsqrt_t)
+        theta_days = -(s_disc * sl * pdf_d1) / (2 * sqrt_t) - w * (r * k_disc * nwd2 - q * s_disc * nwd1)
+        theta = theta_days * _INV_DAYS_PER_YEAR
+        vega = s_disc * pdf_d1 * sqrt_t / 100
+        rho = w * k_disc * Tl * nwd2 / 100
+
+        # Expired / zero-vol -> intrinsic; invalid inputs -> zeros
+        intrinsic = self._intrinsic_value_vec(is_call, S, K)
+        expired = valid & ~live
+        return GreeksChain(
+            price=np.where(live, price, np.where(expired, intrinsic.price, 0.0)),
+            delta=np.where(live, delta, np.where(expired, intrinsic.delta, 0.0)),
+            gamma=np.where(live, gamma, 0.0),
+            theta=np.where(live, theta, 0.0),
+            vega=np.where(live, vega, 0.0),
+            rho=np.where(live, rho, 0.0),
+        )
+
+    def implied_volatility_vec(
+        self,
+        is_call: Any,
+        S: Any,
+        K: Any,
+        T: Any,
+        market_price: Any,
+        r: float | None = None,
+        q: Any = 0.0,
+        precision: float = 0.00001,
+        max_iterations: int = 100,
+        min_iv: float = 0.01,
+        max_iv: float = 5.0,
+    ) -> Any:
+        """
+        Vectorized implied volatility: Newton in lock-step over a whole chain.
 
-            vega = S * math.exp(-q * T) * norm.pdf(d1) * math.sqrt(T) / 100  # For 1% change in vol
+        Mirrors `implied_volatility` element-wise (Corrado-Miller seed, log-price
+        Newton steps, [min_iv, max_iv] clamping, Brent fallback for rows that
+        stall on flat vega or at a bound) but each Newton iteration prices every
+        still-unconverged element with one array evaluation; only stalled rows
+        drop to the scalar Brent solve. `T` is in years.
 
-            rho = K * T * math.exp(-r * T) * norm.cdf(d2) / 100 if is_call else -K * T * math.exp(-r * T) * norm.cdf(-d2) / 100
+        Returns:
+            ndarray of IVs; 0.0 where T <= 0 or S/K are non-positive, min_iv where
+            market_price <= 0.01.
+        """
+        if np is None:
+            raise RuntimeError("implied_volatility_vec requires numpy")
+        if r is None:
+            r = self.risk_free_rate
+        is_call, S, K, T, V, q = np.broadcast_arrays(
+            np.asarray(is_call, dtype=bool),
+            np.asarray(S, dtype=float),
+            np.asarray(K, dtype=float),
+            np.asarray(T, dtype=float),
+            np.asarray(market_price, dtype=float),
+            np.asarray(q, dtype=float),
+        )
+        solvable = (T > 0) & (S > 0) & (K > 0)
+        priced = solvable & (V > 0.01)
+        out = np.where(solvable, min_iv, 0.0)
+        if not priced.any():
+            return out
+
+        # Work on the compacted solvable subset only
+        c, s_, k, t, v, qq = (a[priced] for a in (is_call, S, K, T, V, q))
+
+        # Corrado-Miller seed (see _iv_initial_guess), 0.3 where undefined
+        spot = s_ * np.exp(-qq * t)
+        strike = k * np.exp(-r * t)
+        call = np.where(c, v, v + spot - strike)
+        half_gap = call - (spot - strike) / 2.0
+        disc = np.maximum(half_gap * half_gap - (spot - strike) ** 2 / math.pi, 0.0)
+        seed = np.sqrt(2.0 * math.pi / t) / (spot + strike) * (half_gap + np.sqrt(disc))
+        sigma = np.clip(np.where(np.isfinite(seed) & (seed > 0), seed, 0.3), min_iv, max_iv)
+
+        log_v = np.log(v)
+        active = np.ones(sigma.shape, dtype=bool)
+        iterations = np.zeros(sigma.shape, dtype=np.int64)
+        stalled = np.zeros(sigma.shape, dtype=bool)
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if not idx.size:
+                break
+            iterations[idx] += 1
+            res = self.black_scholes_vec(c[idx], s_[idx], k[idx], t[idx], r, sigma[idx], qq[idx])
+            price = res.price
+            vega = res.vega * 100  # Convert back from 1% to 1.0 scale
+            converged = np.abs(price - v[idx]) < precision
+            flat = ~converged & (np.abs(vega) < 1e-10)
+            step_ok = ~(converged | flat)
+            safe_vega = np.where(step_ok, vega, 1.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_step = (np.log(np.where(price > 0, price, 1.0)) - log_v[idx]) * price / safe_vega
+            step = np.where(price > 0, log_step, (price - v[idx]) / safe_vega)
+            sig_a = sigma[idx]
+            new_sigma = np.where(step_ok, np.clip(sig_a - step, min_iv, max_iv), sig_a)
+            pinned = step_ok & (new_sigma == sig_a)  # clamped onto the same bound again
+            sigma[idx] = new_sigma
+            stalled[idx[flat | pinned]] = True
+            active[idx[~step_ok | pinned]] = False
+
+        # Stalled rows (flat vega / pinned at a bound) finish with the scalar
+        # solver's bracketed Brent fallback on whatever iteration budget is left
+        budget = max_iterations - iterations
+        for i in np.flatnonzero(stalled & (budget > 0)):
+            terms = _precompute(float(s_[i]), float(k[i]), float(t[i]), float(r), float(qq[i]))
+            sigma[i] = _iv_brent(
+                bool(c[i]), float(s_[i]), float(k[i]), float(v[i]), *terms, min_iv, max_iv, precision, int(budget[i])
+            )[0]
+
+        out[priced] = sigma
+        return out
+
+    def _intrinsic_value(self, is_call: bool, S: float, K: float) -> Greeks:
+        """Calculate intrinsic value for expired/near-expired options."""
+        w = 1.0 if is_call else -1.0
+        moneyness = w * (S - K)
+        return Greeks(max(0.0, moneyness), w if moneyness > 0 else 0.0, 0.0, 0.0, 0.0, 0.0)
 
-            return {
-                "price": price,
-                "delta": delta,
-                "gamma": gamma,
-                "theta": theta,
-                "vega": vega,
-                "rho": rho
-            }
+    @staticmethod
+    def _intrinsic_value_vec(is_call: Any, S: Any, K: Any) -> GreeksChain:
+        """Array counterpart of `_intrinsic_value` (e.g. a whole chain at settlement)."""
+        if np is None:
+            raise RuntimeError("_intrinsic_value_vec requires numpy")
+        is_call, S, K = np.broadcast_arrays(
+            np.asarray(is_call, dtype=bool), np.asarray(S, dtype=float), np.asarray(K, dtype=float)
+        )
+        w = np.where(is_call, 1.0, -1.0)
+        moneyness = w * (S - K)
+        zeros = np.zeros(S.shape)
+        return GreeksChain(
+            price=np.where(moneyness > 0, moneyness, 0.0),
+            delta=np.where(moneyness > 0, w, 0.0),
+            gamma=zeros,
+            theta=zeros.copy(),
+            vega=zeros.copy(),
+            rho=zeros.copy(),
+        )
 
-        except Exception as e:
-            # Route analytics calculation error centrally; keep log and fallback
-            handle_api_error(e, component="analytics.option_greeks", context={"fn": "black_scholes"})
-            logger.error("Black-Scholes calculation error: %s", e)
-            return {
-                "price": 0.0,
-                "delta": 0.0,
-                "gamma": 0.0,
-                "theta": 0.0,
-                "vega": 0.0,
-                "rho": 0.0
-            }
-
-    def _intrinsic_value(self, is_call: bool, S: float, K: float) -> dict[str, float]:
-        """Calculate intrinsic value for expired/near-expired options."""
-        if is_call:
-            price = max(0, S - K)
-            delta = 1.0 if S > K else 0.0
-        else:
-            price = max(0, K - S)
-            delta = -1.0 if S < K else 0.0
-
-        return {
-            "price": price,
-            "delta": delta,
-            "gamma": 0.0,
-            "theta": 0.0,
-            "vega": 0.0,
-            "rho": 0.0
-        }
+    @staticmethod
+    def _iv_initial_guess(
+        is_call: bool, S: float, K: float, T: float, market_price: float, r: float, q: float
+    ) -> float:
+        """Corrado-Miller (1996) closed-form IV estimate; 0.3 when it is undefined.
+
+        Puts are mapped to the equivalent call price through put-call parity.
+        Exact at-the-money-forward (reduces to Brenner-Subrahmanyam) and within
+        a few vol points elsewhere, so Newton needs only a couple of polish steps.
+        """
+        try:
+            spot = S * math.exp(-q * T)
+            strike = K * math.exp(-r * T)
+            call = market_price if is_call else market_price + spot - strike
+            half_gap = call - (spot - strike) / 2.0
+            disc = half_gap * half_gap - (spot - strike) ** 2 / math.pi
+            sigma = math.sqrt(2.0 * math.pi / T) / (spot + strike) * (half_gap + math.sqrt(max(0.0, disc)))
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return 0.3
+        if not math.isfinite(sigma) or sigma <= 0:
+            return 0.3
+        return sigma
 
     def implied_volatility(
         self,
@@ -227,34 +729,60 @@ class OptionGreeks:
         if market_price <= 0.01:
             return (min_iv, 0) if return_iterations else min_iv  # Minimum IV to avoid division by zero issues
 
-        # Initial guess
-        sigma = 0.3  # 30% as starting point
+        # Initial guess: Corrado-Miller closed form, then clamp into the solver bounds
+        sigma = self._iv_initial_guess(is_call, S, K, T, market_price, r, q)
         if sigma < min_iv:
             sigma = min_iv
         if sigma > max_iv:
             sigma = max_iv
 
-        # Newton-Raphson iterations
+        if S <= 0 or K <= 0:
+            # No model price exists (zero vega): keep the seed, as one failed step would
+            return (sigma, 1) if return_iterations else sigma
+
+        # sqrt(T), ln(F/K) and discount factors are fixed for the solve; only sigma moves
+        sqrt_t, log_fk, disc_r, disc_q = _precompute(S, K, T, r, q)
+
+        # Newton-Raphson iterations on log-price (Jaeckel): f(sigma) = ln BS(sigma) - ln V
+        # damps the steps where vega is tiny relative to price (deep OTM / short expiry)
+        log_target = math.log(market_price)
+        bs_given_precomputed = _kernels().bs_given_precomputed
         iterations_used = 0
+        stalled = False
         for i in range(max_iterations):
             iterations_used = i + 1
-            bs_price = self.black_scholes(is_call, S, K, T, r, sigma, q)["price"]
+            bs_price, vega = bs_given_precomputed(is_call, S, K, sigma, sqrt_t, log_fk, disc_r, disc_q)
             price_diff = bs_price - market_price
 
             if abs(price_diff) < precision:
                 return (sigma, iterations_used) if return_iterations else sigma
 
-            vega = self.black_scholes(is_call, S, K, T, r, sigma, q)["vega"] * 100  # Convert back from 1% to 1.0 scale
             if abs(vega) < 1e-10:
-                return (sigma, iterations_used) if return_iterations else sigma
+                stalled = True
+                break
 
-            sigma = sigma - price_diff / vega
+            if bs_price > 0:
+                new_sigma = sigma - (math.log(bs_price) - log_target) * bs_price / vega
+            else:
+                new_sigma = sigma - price_diff / vega
 
             # Bounds check
-            if sigma < min_iv:
-                sigma = min_iv
-            elif sigma > max_iv:
-                sigma = max_iv
+            if new_sigma < min_iv:
+                new_sigma = min_iv
+            elif new_sigma > max_iv:
+                new_sigma = max_iv
+            if new_sigma == sigma:  # pinned at a bound: Newton cannot make progress
+                stalled = True
+                break
+            sigma = new_sigma
+
+        budget = max_iterations - iterations_used
+        if stalled and budget > 0:
+            # Flat vega / chatter at a bound: fall back to bracketed Brent on [min_iv, max_iv]
+            sigma, brent_iterations = _iv_brent(
+                is_call, S, K, market_price, sqrt_t, log_fk, disc_r, disc_q, min_iv, max_iv, precision, budget
+            )
+            iterations_used += brent_iterations
 
         # If we didn't converge, return our best guess
         return (sigma, iterations_used) if return_iterations else sigma
@@ -226,6 +226,13 @@ def register_common_variables() -> None:
     EnvVarDefinition(name="RETRY_JITTER", config_path=["resilience", "retry", "jitter"], var_type=EnvVarType.BOOLEAN, description="Retry add jitter", default=True),
     EnvVarDefinition(name="RETRY_WHITELIST", config_path=["resilience", "retry", "whitelist"], var_type=EnvVarType.STRING, description="Retry exception whitelist (CSV of class names)"),
     EnvVarDefinition(name="RETRY_BLACKLIST", config_path=["resilience", "retry", "blacklist"], var_type=EnvVarType.STRING, description="Retry exception blacklist (CSV of class names)"),
+    EnvVarDefinition(
+        name="RETRY_STRICT_TYPES",
+        config_path=["resilience", "retry", "strict_types"],
+        var_type=EnvVarType.BOOLEAN,
+        description="Retry lists match exact exception classes (no subclasses)",
+        default=False,
+    ),
         # Panels / summary bridge toggles (documentation; may be consumed by scripts)
         EnvVarDefinition(name="SUMMARY_PANELS_MODE", config_path=["console", "summary_panels_mode"], var_type=EnvVarType.STRING, description="Summary panels mode toggle", choices=["on","off"]),
         EnvVarDefinition(name="PANELS_DIR", config_path=["console", "panels_dir"], var_type=EnvVarType.STRING, description="Panels directory for bridge"),
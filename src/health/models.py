@@ -7,9 +7,11 @@ for component/check health reporting and mapping to levels.
 """
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from typing import Any
+from typing import Any, Final
 
 
 class HealthLevel(IntEnum):
@@ -28,23 +30,57 @@ class HealthState(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Pre-casefolded status alias -> level; level_from_state is a single dict probe.
+# Keys are interned so probes with interned inputs short-circuit on identity.
+_STATE_TO_LEVEL: dict[str, HealthLevel] = {sys.intern(k): v for k, v in {
+    "healthy": HealthLevel.HEALTHY,
+    "ok": HealthLevel.HEALTHY,
+    "ready": HealthLevel.HEALTHY,
+    "degraded": HealthLevel.DEGRADED,
+    "warning": HealthLevel.WARNING,
+    "warn": HealthLevel.WARNING,
+    "critical": HealthLevel.CRITICAL,
+    "unhealthy": HealthLevel.CRITICAL,
+    "error": HealthLevel.CRITICAL,
+    "failed": HealthLevel.CRITICAL,
+    "unknown": HealthLevel.UNKNOWN,
+}.items()}
+
+
+# Enum inputs skip string handling entirely.
+_STATE_ENUM_TO_LEVEL: Final[dict[HealthState, HealthLevel]] = {
+    HealthState.HEALTHY: HealthLevel.HEALTHY,
+    HealthState.DEGRADED: HealthLevel.DEGRADED,
+    HealthState.WARNING: HealthLevel.WARNING,
+    HealthState.CRITICAL: HealthLevel.CRITICAL,
+    HealthState.UNKNOWN: HealthLevel.UNKNOWN,
+}
+
+# Canonical inverse of _STATE_TO_LEVEL (one status string per level).
+_LEVEL_TO_STATUS: Final[dict[int, str]] = {
+    HealthLevel.HEALTHY: HealthState.HEALTHY.value,
+    HealthLevel.DEGRADED: HealthState.DEGRADED.value,
+    HealthLevel.WARNING: HealthState.WARNING.value,
+    HealthLevel.CRITICAL: HealthState.CRITICAL.value,
+    HealthLevel.UNKNOWN: HealthState.UNKNOWN.value,
+}
+
+
 def level_from_state(state: str | HealthState) -> HealthLevel:
+    if state.__class__ is HealthState:  # exact-type check; cheaper than isinstance
+        return _STATE_ENUM_TO_LEVEL[state]  # type: ignore[index]
     try:
-        s = state.value if isinstance(state, HealthState) else str(state).lower()
+        return _STATE_TO_LEVEL.get(str(state).casefold(), HealthLevel.UNKNOWN)
     except Exception:
-        s = "unknown"
-    if s in ("healthy", "ok", "ready"):
-        return HealthLevel.HEALTHY
-    if s in ("degraded",):
-        return HealthLevel.DEGRADED
-    if s in ("warning", "warn"):
-        return HealthLevel.WARNING
-    if s in ("critical", "unhealthy", "error", "failed"):
-        return HealthLevel.CRITICAL
-    return HealthLevel.UNKNOWN
-
-
-@dataclass
+        return HealthLevel.UNKNOWN
+
+
+def status_from_level(level: HealthLevel | int) -> str:
+    """Return the canonical status string for a level ("unknown" if out of range)."""
+    return _LEVEL_TO_STATUS.get(level, HealthState.UNKNOWN.value)
+
+
+@dataclass(slots=True)
 class ComponentHealth:
     name: str
     status: str = HealthState.UNKNOWN.value
@@ -54,10 +90,11 @@ class ComponentHealth:
 
     @property
     def level(self) -> HealthLevel:
+        # Derived on each read (one dict probe) so it always tracks `status`.
         return level_from_state(self.status)
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckHealth:
     name: str
     status: str = HealthState.UNKNOWN.value
@@ -67,10 +104,11 @@ class CheckHealth:
 
     @property
     def level(self) -> HealthLevel:
+        # Derived on each read (one dict probe) so it always tracks `status`.
         return level_from_state(self.status)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthResponse:
     timestamp: str
     status: str
@@ -79,6 +117,26 @@ class HealthResponse:
     components: dict[str, ComponentHealth] | None = None
     checks: dict[str, CheckHealth] | None = None
 
+    def aggregate_level(self) -> HealthLevel:
+        """Return the worst level across components and checks (UNKNOWN when none).
+
+        Read from the current mappings on each call, so records added, replaced
+        or re-statused after construction are counted; the int levels are
+        gathered into one flat list and reduced with a single max().
+        """
+        levels = [c.level.value for c in (self.components or {}).values()]
+        levels.extend(c.level.value for c in (self.checks or {}).values())
+        return HealthLevel(max(levels, default=HealthLevel.UNKNOWN.value))
+
+
+def worst_level(items: Iterable[ComponentHealth | CheckHealth]) -> HealthLevel:
+    """Return the most severe level across items (UNKNOWN when empty).
+
+    Reduces over raw int values so max() compares native ints rather than
+    dispatching IntEnum comparisons per element.
+    """
+    return HealthLevel(max((i.level.value for i in items), default=HealthLevel.UNKNOWN.value))
+
 
 __all__ = [
     "HealthLevel",
@@ -87,4 +145,6 @@ __all__ = [
     "CheckHealth",
     "HealthResponse",
     "level_from_state",
+    "status_from_level",
+    "worst_level",
 ]
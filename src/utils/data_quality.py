@@ -4,10 +4,364 @@ Data quality utilities for G6 Platform.
 """
 
 import logging
-from typing import Any
+import math
+import statistics
+import sys
+from array import array
+from collections.abc import Callable, Mapping
+from enum import IntFlag
+from functools import reduce
+from importlib import import_module
+from math import isfinite
+from operator import itemgetter, or_
+from typing import Any, Final, NamedTuple
+
+# Optional: columnar validation runs on NumPy arrays (plain lists otherwise),
+# with the per-row kernel JIT-compiled by Numba on first use (see _array_kernel).
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Interned option-type sentinels: str == short-circuits on identity, so records
+# built from the same literals (or interned upstream) skip the char compare.
+_CE: Final = sys.intern("CE")
+_PE: Final = sys.intern("PE")
+
+_REQUIRED_FIELDS: Final = ('strike', 'instrument_type', 'last_price', 'expiry', 'tradingsymbol')
+_REQUIRED_FIELD_SET: Final = frozenset(_REQUIRED_FIELDS)
+_OHLC_FIELDS: Final = ('open', 'high', 'low', 'close')
+# expiry_rule spellings that select the next-week median price check
+_NEXT_WEEK_RULES: Final = frozenset(("next_week", "next", "week_next", "nextweek"))
+# instrument_type codes fed to the validation kernel (0 = not CE/PE)
+_ITYPE_CODES: Final = {_CE: 1, _PE: 2}
+
+# Row flags produced by _validate_arrays. The reject flags are exclusive and
+# follow the per-row check order (first failure wins); the rest mark rows
+# that are kept with an issue.
+_F_BAD_TYPE: Final = 1
+_F_BAD_PRICE: Final = 2
+_F_NEG_PRICE: Final = 4
+_F_BAD_STRIKE: Final = 8
+_F_NEG_VOLUME: Final = 16
+_F_BAD_VOLUME: Final = 32
+_F_NEG_OI: Final = 64
+_F_BAD_OI: Final = 128
+_F_OUTLIER: Final = 256
+
+# Basic sanity rule: an option price shouldn't exceed this fraction of the strike
+# (simplistic; might need adjustment).
+_OUTLIER_PRICE_RATIO: Final = 0.2
+
+
+def _validate_arrays(strike, last_price, instrument_type, volume, oi, out):
+    """Fill out[i] with the _F_* flags for row i of the option columns.
+
+    instrument_type holds _ITYPE_CODES values. Unparseable numerics arrive as
+    NaN and, like NaN / inf inputs, are flagged as invalid; absent volume /
+    OI arrive as 0.0. Written as a scalar loop so the same body runs under
+    Numba, over NumPy arrays, or over plain lists.
+    """
+    for i in range(len(out)):
+        if instrument_type[i] == 0:
+            out[i] = _F_BAD_TYPE
+            continue
+        price = last_price[i]
+        if not isfinite(price):
+            out[i] = _F_BAD_PRICE
+            continue
+        if price < 0:
+            out[i] = _F_NEG_PRICE
+            continue
+        k = strike[i]
+        if not (isfinite(k) and k > 0):
+            out[i] = _F_BAD_STRIKE
+            continue
+        flags = 0
+        v = volume[i]
+        if not isfinite(v):
+            flags |= _F_BAD_VOLUME
+        elif v < 0:
+            flags |= _F_NEG_VOLUME
+        v = oi[i]
+        if not isfinite(v):
+            flags |= _F_BAD_OI
+        elif v < 0:
+            flags |= _F_NEG_OI
+        # Same rule as DataQualityChecker.is_price_outlier_scalar
+        if price > k * _OUTLIER_PRICE_RATIO:
+            flags |= _F_OUTLIER
+        out[i] = flags
+    return out
+
+
+_ARRAY_KERNEL: Callable[..., Any] | None = None
+
+
+def _array_kernel() -> Callable[..., Any]:
+    """_validate_arrays for NumPy columns, Numba-compiled on first use when installed.
+
+    Importing numba and compiling (or loading the JIT cache) happens on the
+    first validation rather than at import, so importers that never validate
+    a chain don't pay for it. Falls back to the pure-Python kernel.
+    """
+    global _ARRAY_KERNEL
+    kernel = _ARRAY_KERNEL
+    if kernel is None:
+        kernel = _validate_arrays
+        try:
+            compiled = import_module("numba").njit(cache=True)(_validate_arrays)
+            # compile (or load the cache) now so a failure falls back here
+            one = np.ones(1)
+            compiled(one, one, np.ones(1, np.int8), one, one, np.zeros(1, np.uint16))
+            kernel = compiled
+        except Exception as e:  # keep the pure-Python kernel
+            logger.debug("Numba JIT unavailable for options validation kernel: %s", e)
+        _ARRAY_KERNEL = kernel
+    return kernel
+
+
+class Issue(IntFlag):
+    """Kinds of issue reported by DataQualityChecker.validate_options_data."""
+
+    EMPTY = 1
+    INVALID_FORMAT = 2
+    MISSING_FIELDS = 4
+    INVALID_INSTRUMENT = 8
+    NEGATIVE_PRICE = 16
+    INVALID_PRICE = 32
+    INVALID_STRIKE = 64
+    NEGATIVE_VOLUME = 128
+    INVALID_VOLUME = 256
+    NEGATIVE_OI = 512
+    INVALID_OI = 1024
+    PRICE_OUTLIER = 2048
+
+
+# Message for each Issue, formatted with (symbol, offending value).
+_ISSUE_MESSAGES: Final = {
+    Issue.EMPTY: "Empty options data",
+    Issue.INVALID_FORMAT: "Invalid data format for {0}",
+    Issue.MISSING_FIELDS: "Missing fields for {0}: {1}",
+    Issue.INVALID_INSTRUMENT: "Invalid instrument_type for {0}: {1}",
+    Issue.NEGATIVE_PRICE: "Negative price for {0}: {1}",
+    Issue.INVALID_PRICE: "Invalid price for {0}: {1}",
+    Issue.INVALID_STRIKE: "Invalid strike for {0}: {1}",
+    Issue.NEGATIVE_VOLUME: "Negative volume for {0}: {1}",
+    Issue.INVALID_VOLUME: "Invalid volume for {0}: {1}",
+    Issue.NEGATIVE_OI: "Negative OI for {0}: {1}",
+    Issue.INVALID_OI: "Invalid OI for {0}: {1}",
+    Issue.PRICE_OUTLIER: "Price outlier detected for {0}: {1}",
+}
+
+
+# Issue of a (Issue, row, value) record collected by _OptionColumns.report
+_issue_kind: Final = itemgetter(0)
+
+
+class IssueList(list[str]):
+    """Issue messages plus the Issue codes behind them.
+
+    Still a plain list of strings for existing callers; new callers can test
+    ``issues.flags & Issue.NEGATIVE_PRICE`` instead of scanning the messages.
+    ``codes`` holds one Issue value per reported issue, in order, and is
+    filled even when messages were not requested (messages=False).
+    """
+
+    __slots__ = ('flags', 'codes')
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.flags = Issue(0)
+        self.codes = array('H')
+
+    @classmethod
+    def empty_input(cls, messages: bool = True) -> "IssueList":
+        """The result for an empty options mapping."""
+        issues = cls([_ISSUE_MESSAGES[Issue.EMPTY]] if messages else [])
+        issues.flags = Issue.EMPTY
+        issues.codes.append(Issue.EMPTY)
+        return issues
+
+
+class OptionQuote(NamedTuple):
+    """One option row with the fields validate_options_data_typed checks.
+
+    Field access is a tuple offset load rather than a dict probe; build from a
+    legacy row dict once with OptionQuote.from_dict.
+    """
+
+    strike: Any
+    instrument_type: Any
+    last_price: Any
+    expiry: Any
+    tradingsymbol: Any
+    volume: Any = None
+    oi: Any = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "OptionQuote":
+        """Build from a row dict (KeyError if a required field is missing).
+
+        OI is read from 'open_interest' when present, else 'oi'.
+        """
+        oi_key = 'open_interest' if 'open_interest' in data else 'oi'
+        return cls(
+            data['strike'],
+            data['instrument_type'],
+            data['last_price'],
+            data['expiry'],
+            data['tradingsymbol'],
+            data.get('volume'),
+            data.get(oi_key),
+        )
+
+
+class _OptionColumns:
+    """Per-row parse results gathered for _validate_arrays.
+
+    Structural rejections, as (Issue, value), and the raw form of values
+    float() could not parse are keyed by row index, so issues keep the
+    per-row order of the checks and quote the offending input. Messages are
+    only formatted in report().
+    """
+
+    __slots__ = ('strikes', 'prices', 'volumes', 'ois', 'itypes', 'rejected', 'raw')
+
+    def __init__(self, n: int) -> None:
+        nan = math.nan
+        self.strikes = [nan] * n
+        self.prices = [nan] * n
+        self.volumes = [0.0] * n
+        self.ois = [0.0] * n
+        self.itypes = [0] * n
+        self.rejected: dict[int, tuple[Issue, Any]] = {}
+        self.raw: dict[tuple[int, str], Any] = {}
+
+    def add(self, i: int, itype: Any, last_price: Any, strike: Any, volume: Any, oi: Any) -> None:
+        """Parse row i's fields; every numeric check is left to the kernel.
+
+        An unparseable value is stored as NaN (kept in raw for the message);
+        parsing stops at the price, as the later fields are moot then.
+        """
+        itype = _ITYPE_CODES.get(itype, 0) if isinstance(itype, str) else 0
+        if not itype:
+            return  # flagged by the kernel
+        self.itypes[i] = itype
+        try:
+            self.prices[i] = float(last_price)
+        except (ValueError, TypeError):
+            self.raw[i, 'last_price'] = last_price
+            return
+        try:
+            self.strikes[i] = float(strike)
+        except (ValueError, TypeError):
+            self.raw[i, 'strike'] = strike
+        if volume is not None:
+            try:
+                self.volumes[i] = float(volume)
+            except (ValueError, TypeError):
+                self.volumes[i] = math.nan
+                self.raw[i, 'volume'] = volume
+        if oi is not None:
+            try:
+                self.ois[i] = float(oi)
+            except (ValueError, TypeError):
+                self.ois[i] = math.nan
+                self.raw[i, 'oi'] = oi
+
+    def report(
+        self,
+        options_data: Mapping[str, Any],
+        symbols: list[str],
+        rows: list[Any],
+        field: Callable[[Any, str], Any],
+        messages: bool = True,
+    ) -> tuple[dict[str, Any], IssueList]:
+        """Run _validate_arrays and turn its flags into (valid_data, issues).
+
+        field(row, name) reads a raw value for an issue message; with
+        messages=False only the issue codes / flags are filled.
+        """
+        n = len(rows)
+        if np is not None:
+            flag_arr = _array_kernel()(
+                np.array(self.strikes, dtype=np.float64),
+                np.array(self.prices, dtype=np.float64),
+                np.array(self.itypes, dtype=np.int8),
+                np.array(self.volumes, dtype=np.float64),
+                np.array(self.ois, dtype=np.float64),
+                np.zeros(n, dtype=np.uint16),
+            )
+            flags = flag_arr.tolist()
+            flagged = np.flatnonzero(flag_arr).tolist()
+        else:  # pragma: no cover - NumPy is normally present
+            flags = _validate_arrays(self.strikes, self.prices, self.itypes, self.volumes, self.ois, [0] * n)
+            flagged = [i for i, f in enumerate(flags) if f]
+
+        # Only rows with something to report are revisited; clean rows pass
+        # straight into valid_data. Each issue is recorded as
+        # (Issue, row, value) and formatted at the end, if at all.
+        rejected = self.rejected
+        raw = self.raw
+        noisy = set(flagged)
+        noisy.update(rejected)
+        found: list[tuple[Issue, int, Any]] = []
+        note = found.append
+        dropped: set[int] = set()
+        for i in sorted(noisy):
+            reject = rejected.get(i)
+            if reject is not None:
+                note((reject[0], i, reject[1]))
+                dropped.add(i)
+                continue
+            f = flags[i]
+            if f & _F_BAD_TYPE:
+                note((Issue.INVALID_INSTRUMENT, i, field(rows[i], 'instrument_type')))
+                dropped.add(i)
+                continue
+            if f & _F_BAD_PRICE:
+                note((Issue.INVALID_PRICE, i, raw.get((i, 'last_price'), self.prices[i])))
+                dropped.add(i)
+                continue
+            if f & _F_NEG_PRICE:
+                note((Issue.NEGATIVE_PRICE, i, self.prices[i]))
+                dropped.add(i)
+                continue
+            if f & _F_BAD_STRIKE:
+                note((Issue.INVALID_STRIKE, i, raw.get((i, 'strike'), self.strikes[i])))
+                dropped.add(i)
+                continue
+            # Volume / OI / outlier issues are informational: the row is kept
+            if f & _F_NEG_VOLUME:
+                note((Issue.NEGATIVE_VOLUME, i, self.volumes[i]))
+            elif f & _F_BAD_VOLUME:
+                note((Issue.INVALID_VOLUME, i, raw.get((i, 'volume'), self.volumes[i])))
+            if f & _F_NEG_OI:
+                note((Issue.NEGATIVE_OI, i, self.ois[i]))
+            elif f & _F_BAD_OI:
+                note((Issue.INVALID_OI, i, raw.get((i, 'oi'), self.ois[i])))
+            if f & _F_OUTLIER:
+                note((Issue.PRICE_OUTLIER, i, field(rows[i], 'last_price')))
+
+        issues = IssueList()
+        if found:
+            codes = issues.codes
+            codes.extend(map(_issue_kind, found))
+            issues.flags = Issue(reduce(or_, codes))
+            if messages:
+                issues.extend(_ISSUE_MESSAGES[kind].format(symbols[i], value) for kind, i, value in found)
+
+        # Copy the input whole (dict copy is presized, no incremental resizes)
+        # and drop rejected rows; deletion keeps the insertion order.
+        valid_data = dict(options_data)
+        for i in dropped:
+            del valid_data[symbols[i]]
+        return valid_data, issues
+
+
 class DataQualityChecker:
     """Data quality validation for options data."""
 
@@ -15,103 +369,71 @@ class DataQualityChecker:
         """Initialize data quality checker."""
         self.logger = logging.getLogger(__name__)
 
-    def validate_options_data(self, options_data):
+    def validate_options_data(self, options_data, *, messages=True):
         """
         Validate options data for quality issues.
 
         Args:
             options_data: Dictionary of options data
+            messages: Format issue messages; when False the returned
+                IssueList is empty and only its ``codes`` / ``flags`` are set
 
         Returns:
             Tuple of (valid_data, issues)
             - valid_data: Dictionary with valid options data
-            - issues: List of data quality issues found
+            - issues: IssueList of data quality issues found; its ``flags``
+              attribute is the Issue mask of every kind reported
         """
-        valid_data = {}
-        issues = []
-
         if not options_data:
-            issues.append("Empty options data")
-            return valid_data, issues
-
-        # Check for each option
-        for symbol, data in options_data.items():
-            # Basic validation
+            return {}, IssueList.empty_input(messages)
+
+        # Gather pass: structural checks and float() parsing stay per row (the
+        # input is a dict of dicts); the numeric checks run column-wise in
+        # _validate_arrays.
+        symbols = list(options_data)
+        rows = list(options_data.values())
+        cols = _OptionColumns(len(rows))
+        add = cols.add
+        rejected = cols.rejected
+        for i, data in enumerate(rows):
             if not isinstance(data, dict):
-                issues.append(f"Invalid data format for {symbol}")
+                rejected[i] = (Issue.INVALID_FORMAT, None)
                 continue
-
-            # Required fields
-            required_fields = [
-                'strike', 'instrument_type', 'last_price',
-                'expiry', 'tradingsymbol'
-            ]
-
-            missing_fields = [f for f in required_fields if f not in data]
-            if missing_fields:
-                issues.append(f"Missing fields for {symbol}: {', '.join(missing_fields)}")
-                continue
-
-            # Type validation
-            if data.get('instrument_type') not in ['CE', 'PE']:
-                issues.append(f"Invalid instrument_type for {symbol}: {data.get('instrument_type')}")
+            if not data.keys() >= _REQUIRED_FIELD_SET:
+                missing_fields = [f for f in _REQUIRED_FIELDS if f not in data]
+                rejected[i] = (Issue.MISSING_FIELDS, ', '.join(missing_fields))
                 continue
+            oi_key = 'open_interest' if 'open_interest' in data else 'oi'
+            add(
+                i, data['instrument_type'], data['last_price'], data['strike'],
+                data.get('volume'), data.get(oi_key),
+            )
+        return cols.report(options_data, symbols, rows, dict.get, messages)
+
+    def validate_options_data_typed(self, rows, *, messages=True):
+        """
+        Validate OptionQuote rows; same checks and messages as validate_options_data.
 
-            # Price validation
-            try:
-                price = float(data.get('last_price', 0))
-                if price < 0:
-                    issues.append(f"Negative price for {symbol}: {price}")
-                    continue
-            except (ValueError, TypeError):
-                issues.append(f"Invalid price for {symbol}: {data.get('last_price')}")
-                continue
+        Args:
+            rows: Mapping of symbol -> OptionQuote (see OptionQuote.from_dict)
+            messages: As for validate_options_data
 
-            # Strike validation
-            try:
-                strike = float(data.get('strike', 0))
-                if strike <= 0:
-                    issues.append(f"Invalid strike for {symbol}: {strike}")
-                    continue
-            except (ValueError, TypeError):
-                issues.append(f"Invalid strike for {symbol}: {data.get('strike')}")
+        Returns:
+            Tuple of (valid_data, issues) as for validate_options_data
+        """
+        if not rows:
+            return {}, IssueList.empty_input(messages)
+
+        symbols = list(rows)
+        quotes = list(rows.values())
+        cols = _OptionColumns(len(quotes))
+        add = cols.add
+        for i, q in enumerate(quotes):
+            if not isinstance(q, OptionQuote):
+                cols.rejected[i] = (Issue.INVALID_FORMAT, None)
                 continue
-
-            # Volume sanity (if present)
-            try:
-                if 'volume' in data and data['volume'] is not None:
-                    v = data.get('volume')
-                    if v is not None:
-                        vol = float(v)
-                        if vol < 0:
-                            issues.append(f"Negative volume for {symbol}: {vol}")
-                            # keep item but mark issue
-            except (ValueError, TypeError):
-                issues.append(f"Invalid volume for {symbol}: {data.get('volume')}")
-
-            # Open interest sanity (if present)
-            try:
-                oi_key = 'open_interest' if 'open_interest' in data else ('oi' if 'oi' in data else None)
-                if oi_key:
-                    v = data.get(oi_key)
-                    if v is not None:
-                        oi_val = float(v)
-                        if oi_val < 0:
-                            issues.append(f"Negative OI for {symbol}: {oi_val}")
-                            # keep item but mark issue
-            except (ValueError, TypeError):
-                if 'open_interest' in data or 'oi' in data:
-                    issues.append(f"Invalid OI for {symbol}: {data.get('open_interest', data.get('oi'))}")
-
-            # Check for extreme values (outliers)
-            if self.is_price_outlier(data):
-                issues.append(f"Price outlier detected for {symbol}: {data.get('last_price')}")
-                # Don't exclude outliers, just log them
-
-            # If we got here, data is valid
-            valid_data[symbol] = data
-
-        return valid_data, issues
+            add(i, q.instrument_type, q.last_price, q.strike, q.volume, q.oi)
+        return cols.report(rows, symbols, quotes, getattr, messages)
 
     def is_price_outlier(self, option_data, z_threshold=3.0):
         """
@@ -125,18 +447,25 @@ class DataQualityChecker:
             bool: True if price is an outlier, False otherwise
         """
         # Need historical data for real outlier detection
-        # This is a placeholder implementation
+        # This is a placeholder implementation; for now, use simple rules
+        return self.is_price_outlier_scalar(
+            float(option_data.get('strike', 0)), float(option_data.get('last_price', 0))
+        )
 
-        # For now, use simple rules
-        price = float(option_data.get('last_price', 0))
+    @staticmethod
+    def is_price_outlier_scalar(strike: float, last_price: float, ratio: float = _OUTLIER_PRICE_RATIO) -> bool:
+        """
+        Scalar form of is_price_outlier for callers that already hold floats.
 
-        # Basic sanity check - option price shouldn't be more than 20% of strike
-        # (This is a simplistic rule and might need adjustment)
-        strike = float(option_data.get('strike', 0))
-        if price > 0.2 * strike:
-            return True
+        Args:
+            strike: Option strike
+            last_price: Option last traded price
+            ratio: Largest plausible price as a fraction of strike
 
-        return False
+        Returns:
+            bool: True if last_price exceeds strike * ratio
+        """
+        return last_price > strike * ratio
 
     def check_expiry_consistency(
         self,
@@ -159,27 +488,47 @@ class DataQualityChecker:
             if not isinstance(options_data, dict) or not options_data:
                 return issues
             rule = (expiry_rule or "").lower().strip()
-            # Gather last_price and iv values
+            # Gather last_price and iv values in one read of the chain; for
+            # monthly rules also split positive prices by CE / PE. A row whose
+            # type or price cannot be read abandons the split (and with it the
+            # static-price check) but not the other checks.
+            split = 'month' in rule
             prices: list[float] = []
             ivs: list[float] = []
+            ce_prices: list[float] = []
+            pe_prices: list[float] = []
             for od in options_data.values():
                 try:
                     p = float(od.get('last_price', 0) or 0)
                     if p > 0:
                         prices.append(p)
                 except Exception:
-                    pass
+                    p = None
                 try:
                     iv = float(od.get('iv', 0) or 0)
                     if iv > 0:
                         ivs.append(iv)
                 except Exception:
                     pass
+                if split:
+                    try:
+                        t = (od.get('instrument_type') or od.get('type') or '').upper()
+                    except Exception:
+                        t = None
+                    if t is None or p is None:
+                        split = False
+                    elif p > 0:
+                        if t == _CE:
+                            ce_prices.append(p)
+                        elif t == _PE:
+                            pe_prices.append(p)
             # Rule-based next-week price anomaly
-            if rule in ("next_week", "next", "week_next", "nextweek") and index_price and prices:
+            if rule in _NEXT_WEEK_RULES and index_price and prices:
                 try:
-                    import statistics as _st
-                    med = _st.median(prices)
+                    if np is not None:
+                        med = float(np.median(np.fromiter(prices, dtype=np.float64, count=len(prices))))
+                    else:  # pragma: no cover - NumPy is normally present
+                        med = statistics.median(prices)
                     # If median option trade is unusually high vs. ATM proxy, flag
                     # Using 0.3 of index_price as simplistic ceiling
                     if med > 0.3 * float(index_price):
@@ -187,28 +536,24 @@ class DataQualityChecker:
                 except Exception:
                     pass
             # IV range sanity
-            if ivs and any(iv > 5.0 for iv in ivs):
+            if ivs and max(ivs) > 5.0:
                 issues.append("iv_out_of_range")
 
             # Monthly static pricing detection (non-fatal; for observability)
-            if 'month' in rule:
+            if split:
                 try:
-                    # Compute diversity in CE and PE prices separately when possible
-                    ce_prices: list[float] = []
-                    pe_prices: list[float] = []
-                    for od in options_data.values():
-                        t = (od.get('instrument_type') or od.get('type') or '').upper()
-                        p = float(od.get('last_price', 0) or 0)
-                        if p <= 0:
-                            continue
-                        if t == 'CE':
-                            ce_prices.append(p)
-                        elif t == 'PE':
-                            pe_prices.append(p)
+                    # Diversity of CE and PE prices, assessed separately
                     def _low_diversity(vals: list[float]) -> bool:
                         if len(vals) < 3:
                             return False
-                        return len({round(v, 2) for v in vals}) <= 2
+                        # Stop at the third distinct price: a live chain
+                        # settles this within the first few strikes.
+                        seen: set[float] = set()
+                        for v in vals:
+                            seen.add(round(v, 2))
+                            if len(seen) > 2:
+                                return False
+                        return True
                     if _low_diversity(ce_prices):
                         issues.append('monthly_ce_price_static')
                     if _low_diversity(pe_prices):
@@ -250,7 +595,7 @@ class DataQualityChecker:
                 return False, issues
 
             # Check OHLC fields
-            for field in ['open', 'high', 'low', 'close']:
+            for field in _OHLC_FIELDS:
                 if field not in index_ohlc:
                     issues.append(f"Missing {field} in OHLC data")
                     return False, issues
@@ -285,29 +630,29 @@ class DataQualityChecker:
         if not options_data:
             return {}
 
-        # Initialize containers
-        call_prices = []
-        put_prices = []
-        call_oi = []
-        put_oi = []
-        call_volume = []
-        put_volume = []
-
-        # Collect data
+        # Single pass: prices are kept for min/max, OI and volume are reduced
+        # as running totals (same left-to-right order as sum(), so identical).
+        call_prices: list[float] = []
+        put_prices: list[float] = []
+        call_oi = put_oi = 0.0
+        call_volume = put_volume = 0.0
         for data in options_data.values():
-            if data.get('instrument_type') == 'CE':
+            itype = data.get('instrument_type')
+            if itype == _CE:
                 call_prices.append(float(data.get('last_price', 0)))
-                call_oi.append(float(data.get('oi', 0)))
-                call_volume.append(float(data.get('volume', 0)))
-            elif data.get('instrument_type') == 'PE':
+                call_oi += float(data.get('oi', 0))
+                call_volume += float(data.get('volume', 0))
+            elif itype == _PE:
                 put_prices.append(float(data.get('last_price', 0)))
-                put_oi.append(float(data.get('oi', 0)))
-                put_volume.append(float(data.get('volume', 0)))
+                put_oi += float(data.get('oi', 0))
+                put_volume += float(data.get('volume', 0))
+        n_calls = len(call_prices)
+        n_puts = len(put_prices)
 
         # Calculate statistics
         stats: dict[str, Any] = {
-            'call_count': int(len(call_prices)),
-            'put_count': int(len(put_prices)),
+            'call_count': n_calls,
+            'put_count': n_puts,
             'total_count': int(len(options_data))
         }
 
@@ -315,33 +660,33 @@ class DataQualityChecker:
         if call_prices:
             stats['call_price_min'] = float(min(call_prices))
             stats['call_price_max'] = float(max(call_prices))
-            stats['call_price_avg'] = float(sum(call_prices) / len(call_prices))
+            stats['call_price_avg'] = float(sum(call_prices) / n_calls)
 
         if put_prices:
             stats['put_price_min'] = float(min(put_prices))
             stats['put_price_max'] = float(max(put_prices))
-            stats['put_price_avg'] = float(sum(put_prices) / len(put_prices))
+            stats['put_price_avg'] = float(sum(put_prices) / n_puts)
 
         # OI statistics
-        if call_oi:
-            stats['call_oi_total'] = float(sum(call_oi))
-            stats['call_oi_avg'] = float(sum(call_oi) / len(call_oi))
+        if n_calls:
+            stats['call_oi_total'] = call_oi
+            stats['call_oi_avg'] = call_oi / n_calls
 
-        if put_oi:
-            stats['put_oi_total'] = float(sum(put_oi))
-            stats['put_oi_avg'] = float(sum(put_oi) / len(put_oi))
+        if n_puts:
+            stats['put_oi_total'] = put_oi
+            stats['put_oi_avg'] = put_oi / n_puts
 
         # PCR
-        if call_oi and put_oi and sum(call_oi) > 0:
-            stats['pcr'] = float(sum(put_oi) / sum(call_oi))
+        if n_calls and n_puts and call_oi > 0:
+            stats['pcr'] = put_oi / call_oi
 
         # Volume statistics
-        if call_volume:
-            stats['call_volume_total'] = float(sum(call_volume))
-            stats['call_volume_avg'] = float(sum(call_volume) / len(call_volume))
+        if n_calls:
+            stats['call_volume_total'] = call_volume
+            stats['call_volume_avg'] = call_volume / n_calls
 
-        if put_volume:
-            stats['put_volume_total'] = float(sum(put_volume))
-            stats['put_volume_avg'] = float(sum(put_volume) / len(put_volume))
+        if n_puts:
+            stats['put_volume_total'] = put_volume
+            stats['put_volume_avg'] = put_volume / n_puts
 
         return stats
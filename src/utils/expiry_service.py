@@ -52,11 +52,12 @@ Future Extensions (not implemented now):
 
 from __future__ import annotations
 
+import calendar
 import json
 import logging
 import os
 from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date as _date, timedelta as _td
 from pathlib import Path
 from src.utils.csv_cache import read_json_cached
@@ -117,6 +118,25 @@ class ExpiryService:
     holiday_fn: Callable[[_date], bool] | None = None
     weekly_dow: int = 3
     monthly_dow: int = 3
+    # (monthly_dow, year, month) -> day of the last `monthly_dow` in that month;
+    # filled once in __post_init__ for reference year-1 .. year+5 so classify()
+    # is a lookup. Keyed on the weekday so a later `monthly_dow` change misses
+    # and falls back to is_monthly_expiry; left empty for an out-of-range
+    # weekday (which never matches) rather than wrapping it modulo 7.
+    _last_anchor: dict[tuple[int, int, int], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        dow = self.monthly_dow
+        if not (isinstance(dow, int) and 0 <= dow <= 6):
+            return
+        base_year = (self.today or _date.today()).year
+        self._last_anchor = {
+            (dow, y, m): _last_dow_of_month(y, m, dow)
+            for y in range(base_year - 1, base_year + 6)
+            for m in range(1, 13)
+        }
 
     # ---- Core Selection -------------------------------------------------
     def select(self, rule: str, candidates: Iterable[_date]) -> _date:
@@ -182,12 +202,24 @@ class ExpiryService:
     # ---- Classification -------------------------------------------------
     def classify(self, expiry: _date) -> dict[str, bool]:
         """Return classification flags for an expiry."""
+        anchor = self._last_anchor.get((self.monthly_dow, expiry.year, expiry.month))
+        if anchor is None:
+            is_monthly = is_monthly_expiry(expiry, monthly_dow=self.monthly_dow)
+        else:
+            is_monthly = expiry.day == anchor
         return {
             "is_weekly": is_weekly_expiry(expiry, weekly_dow=self.weekly_dow),
-            "is_monthly": is_monthly_expiry(expiry, monthly_dow=self.monthly_dow),
+            "is_monthly": is_monthly,
         }
 
 
+def _last_dow_of_month(year: int, month: int, dow: int) -> int:
+    """Return the day-of-month of the last `dow` weekday (Mon=0..Sun=6) in year/month."""
+    first_dow, ndays = calendar.monthrange(year, month)
+    last_dow = (first_dow + ndays - 1) % 7
+    return ndays - ((last_dow - dow) % 7)
+
+
 def is_weekly_expiry(expiry: _date, *, weekly_dow: int = 3) -> bool:
     """Return True if the expiry matches the configured weekly expiry weekday.
 
@@ -264,7 +296,13 @@ def build_expiry_service() -> ExpiryService | None:
         return None
     hol_path = _env_get_str("G6_HOLIDAYS_FILE", "").strip() or None
     holidays = load_holiday_calendar(hol_path)
-    holiday_fn = (lambda d: d in holidays) if holidays else None
+    holiday_fn: Callable[[_date], bool] | None = None
+    if holidays:
+        # Membership is checked per candidate on every select(); int ordinals
+        # hash far cheaper than date objects.
+        holidays_ord = frozenset(d.toordinal() for d in holidays)
+        _contains = holidays_ord.__contains__
+        holiday_fn = lambda d: _contains(d.toordinal())  # noqa: E731
     weekly = _env_get_int("G6_WEEKLY_EXPIRY_DOW", 3)
     monthly = _env_get_int("G6_MONTHLY_EXPIRY_DOW", 3)
     svc = ExpiryService(today=None, holiday_fn=holiday_fn, weekly_dow=weekly, monthly_dow=monthly)
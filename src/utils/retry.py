@@ -8,15 +8,19 @@ Environment knobs:
   G6_RETRY_MAX_ATTEMPTS: default 3
   G6_RETRY_MAX_SECONDS:  overall cap in seconds (default 8)
   G6_RETRY_BACKOFF:      base backoff seconds (default 0.2)
-  G6_RETRY_JITTER:       add random jitter (default on)
+  G6_RETRY_JITTER:       full jitter: wait uniformly in [0, exponential delay] (default on)
   G6_RETRY_WHITELIST:    comma-separated exception class names to retry (default: TimeoutError, ConnectionError)
   G6_RETRY_BLACKLIST:    comma-separated exception class names to NOT retry
+  G6_RETRY_STRICT_TYPES: match listed classes exactly, not their subclasses (default off)
 """
 from __future__ import annotations
 
+import builtins
 import importlib
 import logging
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     from src.collectors.env_adapter import get_bool as _env_get_bool
@@ -39,6 +43,9 @@ except Exception:  # pragma: no cover
 from collections.abc import Callable
 from typing import Any, ParamSpec, TypeVar, cast, overload
 
+# tenacity is a hard dependency (requirements.txt) and stays a top-level import:
+# it is ~12ms of the ~0.7s `src` package import, and function-scoped imports
+# are what the late-import guard (tests/test_no_late_imports.py) rejects.
 from tenacity import (
     Retrying,
     retry,
@@ -46,7 +53,7 @@ from tenacity import (
     stop_after_attempt,
     stop_after_delay,
     wait_exponential,
-    wait_random,
+    wait_random_exponential,
 )
 
 from src.error_handling import ErrorCategory, ErrorSeverity, get_error_handler
@@ -58,22 +65,35 @@ logger = logging.getLogger(__name__)
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Retried when no whitelist is configured: typical transient network errors
+_DEFAULT_RETRYABLES: tuple[type[BaseException], ...] = (TimeoutError, ConnectionError)
 
-def _parse_exception_list(csv: str | None) -> list[type[BaseException]]:
-    if not csv:
-        return []
-    out: list[type[BaseException]] = []
-    def _resolve_exception(_name: str) -> type[BaseException] | None:
+
+# Exception classes by name, seeded with every builtin exception at import
+# (resolution is then a dict lookup rather than getattr on builtins).
+# Dotted names (pkg.mod.ErrorCls) are added on first successful resolution.
+_EXC_REGISTRY: dict[str, type[BaseException]] = {
+    name: obj for name, obj in vars(builtins).items()
+    if isinstance(obj, type) and issubclass(obj, BaseException)
+}
+
+
+# Unknown names already warned about (each is reported once per process)
+_WARNED_UNKNOWN: set[str] = set()
+
+
+def _resolve_exception(name: str) -> type[BaseException] | None:
+    exc = _EXC_REGISTRY.get(name)
+    if exc is not None:
+        return exc
+    # Undotted names can only be builtin exceptions, and those are all registered
+    if '.' in name:
         try:
-            # support builtins like TimeoutError and fully qualified names
-            if '.' not in _name:
-                exc = getattr(__import__('builtins'), _name)
-            else:
-                mod_name, cls_name = _name.rsplit('.', 1)
-                mod = importlib.import_module(mod_name)
-                exc = getattr(mod, cls_name)
-            if isinstance(exc, type) and issubclass(exc, BaseException):
-                return exc
+            mod_name, cls_name = name.rsplit('.', 1)
+            obj = getattr(importlib.import_module(mod_name), cls_name)
+            if isinstance(obj, type) and issubclass(obj, BaseException):
+                _EXC_REGISTRY[name] = obj
+                return obj
         except Exception as e:
             # Route to central handler but keep behavior: just skip unknown names
             get_error_handler().handle_error(
@@ -82,83 +102,179 @@ def _parse_exception_list(csv: str | None) -> list[type[BaseException]]:
                 severity=ErrorSeverity.LOW,
                 component="utils.retry",
                 function_name="_parse_exception_list",
-                message=f"Unknown exception type in retry list: {_name}",
-                context={"token": _name},
+                message=f"Unknown exception type in retry list: {name}",
+                context={"token": name},
                 should_log=False,
                 should_reraise=False,
             )
-        return None
+    if name not in _WARNED_UNKNOWN:
+        _WARNED_UNKNOWN.add(name)
+        logger.warning("Unknown exception type in retry list: %s (ignored)", name)
+    return None
 
-    for name in (x.strip() for x in csv.split(',') if x.strip()):
+
+def _parse_exception_list(names: tuple[str, ...]) -> tuple[type[BaseException], ...]:
+    """Resolve exception names, dropping unknown names and duplicates."""
+    out: dict[type[BaseException], None] = {}
+    for name in names:
         exc = _resolve_exception(name)
         if exc is not None:
-            out.append(exc)
-    return out
-
-
-def build_retry_predicate() -> Callable[[BaseException], bool]:
-    wl = _parse_exception_list(_env_get_str('G6_RETRY_WHITELIST', '') or None)
-    bl = _parse_exception_list(_env_get_str('G6_RETRY_BLACKLIST', '') or None)
-    def _predicate(e: BaseException) -> bool:
-        # If blacklisted, do not retry
-        if any(isinstance(e, t) for t in bl):
-            return False
-        # If whitelist provided, only retry those
-        if wl:
-            return any(isinstance(e, t) for t in wl)
-        # Default: typical transient network errors
-        default_retryables = (TimeoutError, ConnectionError)
-        return isinstance(e, default_retryables)
-    return _predicate
-
-
-def build_wait_strategy() -> Any:
-    try:
-        base = float(_env_get_str('G6_RETRY_BACKOFF', '0.2') or '0.2')
-    except Exception:
-        base = 0.2
-    # Default jitter to True if env missing (legacy behavior)
-    jitter = _env_get_bool('G6_RETRY_JITTER', True)
-    exp = wait_exponential(multiplier=base, min=base, max=2.5)
-    if jitter:
-        return exp + wait_random(0, base)
-    return exp
-
-
-def build_stop_strategy() -> Any:
-    try:
-        attempts = int(_env_get_str('G6_RETRY_MAX_ATTEMPTS', '3') or '3')
-    except Exception:
-        attempts = 3
-    try:
-        max_seconds = float(_env_get_str('G6_RETRY_MAX_SECONDS', '8') or '8')
-    except Exception:
-        max_seconds = 8.0
+            out[exc] = None
+    return tuple(out)
+
+
+def _split_names(csv: str) -> tuple[str, ...]:
+    return tuple(x.strip() for x in csv.split(',') if x.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
+    """Explicit retry settings; defaults match the G6_RETRY_* env defaults.
+
+    The builders, retryable and call_with_retry read the env (via from_env)
+    when no config is passed.
+    """
+    whitelist: tuple[str, ...] = ()
+    blacklist: tuple[str, ...] = ()
+    max_attempts: int = 3
+    max_seconds: float = 8.0
+    backoff: float = 0.2
+    jitter: bool = True
+    strict_types: bool = False
+
+    @classmethod
+    def from_env(cls) -> RetryConfig:
+        try:
+            attempts = int(_env_get_str('G6_RETRY_MAX_ATTEMPTS', '3') or '3')
+        except Exception:
+            attempts = 3
+        try:
+            max_seconds = float(_env_get_str('G6_RETRY_MAX_SECONDS', '8') or '8')
+        except Exception:
+            max_seconds = 8.0
+        try:
+            backoff = float(_env_get_str('G6_RETRY_BACKOFF', '0.2') or '0.2')
+        except Exception:
+            backoff = 0.2
+        return cls(
+            whitelist=_split_names(_env_get_str('G6_RETRY_WHITELIST', '')),
+            blacklist=_split_names(_env_get_str('G6_RETRY_BLACKLIST', '')),
+            max_attempts=attempts,
+            max_seconds=max_seconds,
+            backoff=backoff,
+            # Default jitter to True if env missing (legacy behavior)
+            jitter=_env_get_bool('G6_RETRY_JITTER', True),
+            strict_types=_env_get_bool('G6_RETRY_STRICT_TYPES', False),
+        )
+
+
+def build_retry_predicate(config: RetryConfig | None = None) -> Callable[[BaseException], bool]:
+    """Predicate deciding whether an exception is retried.
+
+    Without a config the env lists are snapshotted on every call; the parsed
+    predicate is shared by all callers that see the same whitelist/blacklist.
+    """
+    if config is None:
+        return _cached_retry_predicate(
+            _split_names(_env_get_str('G6_RETRY_WHITELIST', '')),
+            _split_names(_env_get_str('G6_RETRY_BLACKLIST', '')),
+            _env_get_bool('G6_RETRY_STRICT_TYPES', False),
+        )
+    return _cached_retry_predicate(config.whitelist, config.blacklist, config.strict_types)
+
+
+@lru_cache(maxsize=32)
+def _cached_retry_predicate(
+    whitelist: tuple[str, ...], blacklist: tuple[str, ...], strict_types: bool = False,
+) -> Callable[[BaseException], bool]:
+    # Resolved once per distinct (whitelist, blacklist, strict_types)
+    wl = _parse_exception_list(whitelist)
+    bl = _parse_exception_list(blacklist)
+    # Without a whitelist: typical transient network errors
+    return _compile_predicate(wl or _DEFAULT_RETRYABLES, bl, strict_types)
+
+
+def _compile_predicate(
+    retry_on: tuple[type[BaseException], ...],
+    never_retry: tuple[type[BaseException], ...],
+    strict_types: bool = False,
+) -> Callable[[BaseException], bool]:
+    """Generate a predicate specialised to the resolved lists.
+
+    The blacklist (which wins over the whitelist) is emitted only when
+    non-empty, so each call is one or two checks with no branching on list
+    contents. Inheriting mode uses isinstance over tuples; strict mode tests
+    type(e) membership in frozensets, which skips the MRO walk but no longer
+    matches subclasses. The collections are bound as globals of the
+    generated function.
+    """
+    if strict_types:
+        ns: dict[str, Any] = {"_RETRY_ON": frozenset(retry_on), "_NEVER_RETRY": frozenset(never_retry)}
+        check = "type(e) in {}"
+    else:
+        ns = {"_RETRY_ON": retry_on, "_NEVER_RETRY": never_retry}
+        check = "isinstance(e, {})"
+    body = check.format("_RETRY_ON")
+    if never_retry:
+        body = f"not {check.format('_NEVER_RETRY')} and {body}"
+    source = f"def _predicate(e):\n    return {body}"
+    exec(compile(source, "<retry predicate>", "exec"), ns)
+    return ns["_predicate"]
+
+
+def build_wait_strategy(config: RetryConfig | None = None) -> Any:
+    cfg = config or RetryConfig.from_env()
+    base = cfg.backoff
+    if cfg.jitter:
+        # "Full jitter": uniform over [0, min(base * 2^(attempt-1), cap)], which
+        # spreads out retries from many clients failing at the same moment.
+        return wait_random_exponential(multiplier=base, max=2.5)
+    return wait_exponential(multiplier=base, min=base, max=2.5)
+
+
+def build_stop_strategy(config: RetryConfig | None = None) -> Any:
+    cfg = config or RetryConfig.from_env()
     # Use both limits: whichever comes first
-    return stop_after_attempt(attempts) | stop_after_delay(max_seconds)
+    return stop_after_attempt(cfg.max_attempts) | stop_after_delay(cfg.max_seconds)
+
+
+@lru_cache(maxsize=16)
+def _strategies_for(config: RetryConfig) -> tuple[Any, Any, Any]:
+    """(retry, wait, stop) strategies for a config, shared by every caller using it.
+
+    Only the stateless strategy objects are interned: tenacity keeps per-call
+    state on the Retrying instance, so each decorated function / call still
+    gets its own.
+    """
+    return (
+        retry_if_exception(build_retry_predicate(config)),
+        build_wait_strategy(config),
+        build_stop_strategy(config),
+    )
 
 
 @overload
-def retryable(func: None = None, *, reraise: bool = True) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+def retryable(
+    func: None = None, *, reraise: bool = True, config: RetryConfig | None = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 @overload
-def retryable(func: Callable[P, R], *, reraise: bool = True) -> Callable[P, R]: ...
+def retryable(func: Callable[P, R], *, reraise: bool = True, config: RetryConfig | None = None) -> Callable[P, R]: ...
 
 def retryable(
     func: Callable[P, R] | None = None,
     *,
     reraise: bool = True,
+    config: RetryConfig | None = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]] | Callable[P, R]:
-    """Decorator to apply retry with default env-configured strategies.
+    """Decorator to apply retry with env-configured (or explicit ``config``) strategies.
 
     Example:
         @retryable
         def fetch():
             ...
     """
-    predicate = build_retry_predicate()
-    wait = build_wait_strategy()
-    stop = build_stop_strategy()
+    retry_on, wait, stop = _strategies_for(config or RetryConfig.from_env())
     def _safe_reason(rs: object) -> object | None:
         try:
             outcome = getattr(rs, 'outcome', None)
@@ -178,7 +294,7 @@ def retryable(
 
     def _decorator(f: Callable[P, R]) -> Callable[P, R]:
         wrapped = retry(
-            retry=retry_if_exception(predicate),
+            retry=retry_on,
             wait=wait,
             stop=stop,
             reraise=reraise,
@@ -195,24 +311,23 @@ def retryable(
 def call_with_retry(fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
     """Call a function with retry using env-configured strategies.
 
-    Raises RetryError if operation ultimately fails.
+    Raises RetryError (chained to the original exception) if the operation
+    ultimately fails, including on the first non-retryable error, which is
+    not retried.
     """
-    predicate = build_retry_predicate()
-    wait = build_wait_strategy()
-    stop = build_stop_strategy()
+    retry_on, wait, stop = _strategies_for(RetryConfig.from_env())
+    retrying = Retrying(retry=retry_on, wait=wait, stop=stop, reraise=True)
     try:
-        for attempt in Retrying(
-            retry=retry_if_exception(lambda e: predicate(e)),
-            wait=wait,
-            stop=stop,
-            reraise=True,
-        ):
-            with attempt:
-                return fn(*args, **kwargs)
+        return retrying(fn, *args, **kwargs)
     except Exception as e:  # underlying exception
         raise RetryError(str(e)) from e
-    # Should be unreachable: Retrying either returns or raises
-    raise RetryError("Operation did not execute")
 
 
-__all__ = ["retryable", "call_with_retry", "build_retry_predicate", "build_wait_strategy", "build_stop_strategy"]
+__all__ = [
+    "RetryConfig",
+    "retryable",
+    "call_with_retry",
+    "build_retry_predicate",
+    "build_wait_strategy",
+    "build_stop_strategy",
+]
@@ -5,7 +5,11 @@ Standardized symbol handling.
 
 from __future__ import annotations
 
-from typing import TypedDict
+import sys
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, TypedDict
 
 
 class _IndexInfo(TypedDict):
@@ -14,18 +18,24 @@ class _IndexInfo(TypedDict):
     segment: str
     exchange: str
 
-# Keyed by root symbol
-INDEX_INFO: dict[str, _IndexInfo] = {
-    # ... existing entries replaced below
+# Keyed by root symbol. Read-only: INDEX_INFO is a MappingProxyType view (entries
+# too), so no caller can mutate the shared config behind the memoised lookups.
+# Module code reads the backing dict directly (no proxy indirection).
+# Root keys are interned so every canonical root handed out is the same object
+# and downstream dict lookups keyed by it short-circuit on identity.
+_INDEX_INFO: dict[str, _IndexInfo] = {
+    sys.intern(root): info
+    for root, info in {
+        "NIFTY": _IndexInfo(display="Nifty 50", strike_step=50, segment="NFO-OPT", exchange="NSE"),
+        "BANKNIFTY": _IndexInfo(display="Bank Nifty", strike_step=100, segment="NFO-OPT", exchange="NSE"),
+        "FINNIFTY": _IndexInfo(display="Fin Nifty", strike_step=50, segment="NFO-OPT", exchange="NSE"),
+        "MIDCPNIFTY": _IndexInfo(display="Midcap Nifty", strike_step=25, segment="NFO-OPT", exchange="NSE"),
+        "SENSEX": _IndexInfo(display="Sensex", strike_step=100, segment="BFO-OPT", exchange="BSE"),
+    }.items()
 }
-
-INDEX_INFO.update({
-    "NIFTY": _IndexInfo(display="Nifty 50", strike_step=50, segment="NFO-OPT", exchange="NSE"),
-    "BANKNIFTY": _IndexInfo(display="Bank Nifty", strike_step=100, segment="NFO-OPT", exchange="NSE"),
-    "FINNIFTY": _IndexInfo(display="Fin Nifty", strike_step=50, segment="NFO-OPT", exchange="NSE"),
-    "MIDCPNIFTY": _IndexInfo(display="Midcap Nifty", strike_step=25, segment="NFO-OPT", exchange="NSE"),
-    "SENSEX": _IndexInfo(display="Sensex", strike_step=100, segment="BFO-OPT", exchange="BSE"),
-})
+INDEX_INFO: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {root: MappingProxyType(info) for root, info in _INDEX_INFO.items()}
+)
 
 class NormalizedSymbol(TypedDict):
     root: str
@@ -35,75 +45,127 @@ class NormalizedSymbol(TypedDict):
     exchange: str
 
 
+# Canonical results for every known root (and the empty/blank symbol), built once;
+# _normalized_view hands out these shared read-only views instead of allocating.
+_NORMALIZED: dict[str, Mapping[str, Any]] = {
+    root: MappingProxyType(NormalizedSymbol(
+        root=root,
+        display=info["display"],
+        strike_step=info["strike_step"],
+        segment=info["segment"],
+        exchange=info["exchange"],
+    ))
+    for root, info in _INDEX_INFO.items()
+}
+_NORMALIZED_EMPTY: Mapping[str, Any] = MappingProxyType(NormalizedSymbol(
+    root="UNKNOWN",
+    display="Unknown",
+    strike_step=50,
+    segment="NFO-OPT",
+    exchange="NSE",
+))
+
+
+def _build_root_dispatch(results: Mapping[str, Mapping[str, Any]]) -> Callable[[str], Mapping[str, Any] | None]:
+    """Compile INDEX_INFO into a fixed if/elif chain: clean symbol -> shared result of its root.
+
+    INDEX_INFO is fixed at import, so the roots are unrolled into source and
+    exec'd once: one compare on the first character picks a group, then
+    startswith() tries that group's roots longest first (the longest matching
+    root wins). No hashing or per-root loop on the lookup path.
+    """
+    groups: dict[str, list[str]] = {}
+    for root in results:
+        groups.setdefault(root[:1], []).append(root)
+    ns: dict[str, Any] = {}
+    lines = ["def _match_root(clean):", "    head = clean[:1]"]
+    keyword = "if"
+    for head, roots in groups.items():
+        lines.append(f"    {keyword} head == {head!r}:")
+        for root in sorted(roots, key=len, reverse=True):
+            name = f"_R{len(ns)}"
+            ns[name] = results[root]
+            lines.append(f"        if clean.startswith({root!r}):")
+            lines.append(f"            return {name}")
+        keyword = "elif"
+    lines.append("    return None")
+    exec(compile("\n".join(lines), "<symbol_utils root dispatch>", "exec"), ns)
+    return ns["_match_root"]
+
+
+_match_root = _build_root_dispatch(_NORMALIZED)
+
+
+@lru_cache(maxsize=512)
+def _normalized_view(symbol: str) -> Mapping[str, Any]:
+    """Memoised normalize_symbol result as a shared read-only view (see normalize_symbol)."""
+    if not symbol:
+        return _NORMALIZED_EMPTY
+
+    # Remove whitespace; blank input is the empty symbol (no upper() or dispatch)
+    clean = symbol.strip()
+    if not clean:
+        return _NORMALIZED_EMPTY
+    # Unconditional: an isupper()/isascii() pre-check to skip this copy costs
+    # more than the short copy itself, and repeats are served by the lru_cache.
+    clean = clean.upper()
+
+    # Exact and partial (prefix) matches via the generated dispatch
+    known = _match_root(clean)
+    if known is not None:
+        return known
+
+    # Default case (interned once per distinct symbol thanks to the lru_cache)
+    clean = sys.intern(clean)
+    return MappingProxyType(NormalizedSymbol(
+        root=clean,
+        display=clean,
+        strike_step=50,
+        segment="NFO-OPT",
+        exchange="NSE",
+    ))
+
+
 def normalize_symbol(symbol: str) -> NormalizedSymbol:
     """
     Normalize a trading symbol to canonical form.
 
+    The lookup is memoised (callers pass a small set of repeating symbols);
+    each call returns its own copy of the cached result, so callers may
+    mutate or serialise it freely.
+
     Args:
         symbol: Trading symbol (e.g., "NIFTY", "BANKNIFTY")
 
     Returns:
         Dictionary with normalized symbol information
     """
-    if not symbol:
-        return NormalizedSymbol(
-            root="UNKNOWN",
-            display="Unknown",
-            strike_step=50,
-            segment="NFO-OPT",
-            exchange="NSE",
-        )
-
-    # Convert to uppercase and remove whitespace
-    clean = symbol.strip().upper()
-
-    # Check for exact matches
-    if clean in INDEX_INFO:
-        info = INDEX_INFO[clean]
-        return NormalizedSymbol(
-            root=clean,
-            display=info["display"],
-            strike_step=info["strike_step"],
-            segment=info["segment"],
-            exchange=info["exchange"],
-        )
-
-    # Check for partial matches
-    for key, info in INDEX_INFO.items():
-        if clean.startswith(key):
-            return NormalizedSymbol(
-                root=key,
-                display=info["display"],
-                strike_step=info["strike_step"],
-                segment=info["segment"],
-                exchange=info["exchange"],
-            )
-
-    # Default case
-    return NormalizedSymbol(
-        root=clean,
-        display=clean,
-        strike_step=50,
-        segment="NFO-OPT",
-        exchange="NSE",
-    )
+    return dict(_normalized_view(symbol))  # type: ignore[return-value]
+
+
+normalize_symbol.cache_clear = _normalized_view.cache_clear  # type: ignore[attr-defined]
+
 
+@lru_cache(maxsize=512)
 def get_segment(symbol: str) -> str | None:
     """Get segment for a symbol."""
-    norm = normalize_symbol(symbol)
+    norm = _normalized_view(symbol)
     return norm.get("segment")
 
+@lru_cache(maxsize=512)
 def get_exchange(symbol: str) -> str:
     """Get exchange for a symbol."""
-    norm = normalize_symbol(symbol)
+    norm = _normalized_view(symbol)
     return norm.get("exchange", "NSE")
 
+@lru_cache(maxsize=512)
 def get_strike_step(symbol: str) -> int:
     """Get strike step for a symbol."""
-    norm = normalize_symbol(symbol)
+    norm = _normalized_view(symbol)
     return norm.get("strike_step", 50)
 
+@lru_cache(maxsize=512)
 def get_display_name(symbol: str) -> str:
     """Get display name for a symbol."""
-    norm = normalize_symbol(symbol)
+    norm = _normalized_view(symbol)
     return norm.get("display", symbol)
@@ -264,6 +264,60 @@ def kite_provider():
 
 # Legacy collection_loop fully removed (2025-09-28); prior gating env flags retired.
 
+# ---------------------------------------------------------------------------
+# Source AST cache (session): parse src/**/*.py once and run the fused
+# guard traversal once for all AST style guards.
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def src_py_files():
+    """Return the repo-relative src/ module paths shared by all AST style guards."""
+    from tests.src_ast_utils import list_src_files  # type: ignore
+    return list_src_files()
+
+
+@pytest.fixture(scope='session')
+def src_ast_cache():
+    """Return {repo-relative Path: ParsedSource(text, tree, raw)} for every module under src/."""
+    from tests.src_ast_utils import parse_src_tree  # type: ignore
+    return parse_src_tree()
+
+
+@pytest.fixture(scope='session')
+def src_guard_findings(request):
+    """Return {repo-relative Path: GuardFindings} from one fused traversal per module.
+
+    G6_GUARD_PARALLEL=1 parses and scans in a process pool instead (CI / repeated
+    runs); otherwise the in-process src_ast_cache is reused.
+    """
+    from tests.src_ast_utils import may_log_fstring, scan_src_tree_parallel, scan_tree  # type: ignore
+    if is_truthy_env('G6_GUARD_PARALLEL'):
+        return scan_src_tree_parallel()
+    src_ast_cache = request.getfixturevalue('src_ast_cache')
+    return {rel: scan_tree(src.tree, may_log_fstring(src.raw)) for rel, src in src_ast_cache.items()}
+
+
+# ---------------------------------------------------------------------------
+# Symbol normalisation cache (session): warm the normalize_symbol / get_*
+# lru_caches for every known index root once, so per-test lookups are hits.
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope='session')
+def warm_symbol_cache():
+    """Warm symbol_utils caches for INDEX_INFO roots (upper / lower case); returns the module."""
+    from src.utils import symbol_utils  # type: ignore
+    accessors = (
+        symbol_utils.normalize_symbol,
+        symbol_utils.get_segment,
+        symbol_utils.get_exchange,
+        symbol_utils.get_strike_step,
+        symbol_utils.get_display_name,
+    )
+    for root in symbol_utils.INDEX_INFO:
+        for variant in (root, root.lower()):
+            for fn in accessors:
+                fn(variant)
+    return symbol_utils
+
+
 def pytest_collection_modifyitems(config, items):  # pragma: no cover (collection phase)
     if G6_TEST_MINIMAL:
         return  # Skip gating entirely in minimal mode
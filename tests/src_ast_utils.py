@@ -0,0 +1,235 @@
+"""Shared source-tree parsing for the AST style guards.
+
+Both `test_logging_style_guard` and `test_no_late_imports` inspect every
+module under `src/`. Parsing is the dominant cost of those guards, so the
+tree is parsed once per session (see the `src_ast_cache` fixture in
+conftest) and a single fused traversal collects the findings for both
+guards (`src_guard_findings` fixture). Files are read and parsed on a small
+thread pool; the per-file late-import guard is parametrized and so also
+load-balances across xdist workers (`pytest -n auto`).
+
+Exported:
+  REPO_ROOT / SRC_DIR
+  list_src_files(src_dir: Path) -> tuple[Path, ...]
+  ParsedSource(text, tree, raw)
+  parse_src_tree(src_dir: Path, max_workers: int) -> dict[Path, ParsedSource]
+  may_log_fstring(raw: bytes) -> bool
+  scan_tree(tree: ast.AST, check_logging: bool = True) -> GuardFindings
+  scan_src_tree_parallel(src_dir: Path, processes: int | None) -> dict[Path, GuardFindings]
+
+Keys are paths relative to the repo root (e.g. ``src/utils/retry.py``) so
+they compare equal to the ``Path("src").rglob`` parametrization used by the
+late-import guard. Files that fail to read or parse are omitted; the
+guards treat them as clean and leave syntax errors to the rest of the suite.
+
+This module deliberately avoids pytest imports so it can be reused from
+ad-hoc scripts.
+"""
+from __future__ import annotations
+
+import ast
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Final, NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+
+# Interned so membership tests against (interned) ast.Attribute.attr names hit on identity.
+LEVELS: Final = frozenset(map(sys.intern, ("debug", "info", "warning", "error", "critical")))
+
+# AST-only compile flags; PyCF_OPTIMIZED_AST (3.13+) additionally constant-folds
+# and, with optimize=2, drops docstrings so the guards walk fewer nodes.
+_COMPILE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZED_AST", 0)
+
+
+class ParsedSource(NamedTuple):
+    text: str
+    tree: ast.Module
+    raw: bytes
+
+
+def _read_bytes(p: Path) -> bytes:
+    # One open + (normally) one read sized from fstat; cheaper than Path.read_bytes
+    # for the small modules that make up src/.
+    fd = os.open(p, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:  # short read (rare): drain the remainder
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _parse_one(p: Path) -> ParsedSource | None:
+    try:
+        raw = _read_bytes(p)
+        text = raw.decode("utf-8")
+        tree = compile(text, str(p), "exec", flags=_COMPILE_FLAGS, dont_inherit=True, optimize=2)
+        return ParsedSource(text, tree, raw)
+    except Exception:
+        return None
+
+
+@cache
+def list_src_files(src_dir: Path = SRC_DIR) -> tuple[Path, ...]:
+    """Repo-relative paths of every module under src_dir, skipping archived/external code.
+
+    Cached so collection-time parametrization and the session fixtures share one rglob.
+    """
+    out: list[Path] = []
+    for p in src_dir.rglob("*.py"):
+        rel = p.relative_to(REPO_ROOT)
+        if "external" in rel.as_posix().lower():
+            continue
+        out.append(rel)
+    return tuple(out)
+
+
+def parse_src_tree(src_dir: Path = SRC_DIR, max_workers: int = 8) -> dict[Path, ParsedSource]:
+    files = list_src_files(src_dir)
+    # Files are independent; overlap read I/O (GIL released) with parsing.
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        parsed = list(ex.map(_parse_one, (REPO_ROOT / rel for rel in files)))
+    return {rel: r for rel, r in zip(files, parsed, strict=True) if r is not None}
+
+
+# ---------------------------------------------------------------------------
+# Logger f-string detection
+# ---------------------------------------------------------------------------
+# An f-string prefix is f, optionally paired with r on either side, in any case
+# (f"", rf'', FR"", ...); every spelling ends in "f" or "fr" right before the quote.
+_FSTRING_PREFIX = re.compile(rb"(?i)fr?['\"]")
+
+
+def may_log_fstring(raw: bytes) -> bool:
+    """Cheap byte-level prefilter: False when the file cannot contain logger.<level>(f"...")."""
+    if b"logger" not in raw and b"log." not in raw:
+        return False
+    return _FSTRING_PREFIX.search(raw) is not None
+
+
+def is_logger_fstring_call(call: ast.Call) -> bool:
+    """Match logger.<level>(f"...", ...) inspecting the call once, cheapest checks first."""
+    func = call.func
+    if not isinstance(func, ast.Attribute) or func.attr not in LEVELS:
+        return False
+    if not call.args:
+        return False
+    first = call.args[0]
+    # f"..." compiles to ast.JoinedStr; also catch concatenations starting with an f-string
+    if not (
+        isinstance(first, ast.JoinedStr)
+        or (isinstance(first, ast.BinOp) and isinstance(first.left, ast.JoinedStr))
+    ):
+        return False
+    # Receiver check last. Inspect only the receiver's last name component
+    # instead of joining the whole dotted chain: "logger" holds no dot, so the
+    # chain ends with it iff the last component does. Accepts logger,
+    # self.logger, _logger, and a bare (single-component) log.
+    value = func.value
+    if isinstance(value, ast.Attribute):
+        last = value.attr
+        single = not isinstance(value.value, (ast.Attribute, ast.Name))
+    elif isinstance(value, ast.Name):
+        last = value.id
+        single = True
+    else:
+        return False
+    return last.endswith("logger") or (single and last == "log")
+
+
+# ---------------------------------------------------------------------------
+# Fused guard traversal
+# ---------------------------------------------------------------------------
+@dataclass
+class GuardFindings:
+    fstring_violations: list[int] = field(default_factory=list)  # line numbers
+    late_imports: list[tuple[int, str]] = field(default_factory=list)  # (lineno, code)
+
+
+_FUNC_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+# Fields that hold statement lists. Imports are statements, so when only the
+# late-import check is live, decorators, defaults, annotations and every other
+# expression subtree can be pruned.
+_STMT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def scan_tree(tree: ast.AST, check_logging: bool = True) -> GuardFindings:
+    """Single descent collecting eager logger f-strings and function-scoped imports.
+
+    check_logging=False (file ruled out by may_log_fstring) skips the logger
+    predicate. Traversal is an explicit DFS stack over ast.iter_child_nodes
+    rather than ast.walk / NodeVisitor dispatch; each entry carries whether it
+    sits inside a function body. Without the logger check only statement-list
+    fields are followed (see _STMT_FIELDS).
+    """
+    findings = GuardFindings()
+    fstrings = findings.fstring_violations
+    late = findings.late_imports
+    iter_children = ast.iter_child_nodes
+    stack: list[tuple[ast.AST, bool]] = [(tree, False)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, in_func = pop()
+        if isinstance(node, ast.Call):
+            if check_logging and is_logger_fstring_call(node):
+                fstrings.append(node.lineno)
+        elif isinstance(node, ast.Import):
+            if in_func:
+                modnames = ", ".join(alias.name for alias in node.names)
+                late.append((node.lineno, f"import {modnames}"))
+            continue
+        elif isinstance(node, ast.ImportFrom):
+            if in_func:
+                module = node.module or ""
+                names = ", ".join(alias.name for alias in node.names)
+                late.append((node.lineno, f"from {module} import {names}"))
+            continue
+        elif isinstance(node, _FUNC_DEFS):
+            in_func = True
+        if check_logging:
+            for child in iter_children(node):
+                push((child, in_func))
+        else:
+            for name in _STMT_FIELDS:
+                stmts = getattr(node, name, None)
+                if type(stmts) is list:
+                    for child in stmts:
+                        push((child, in_func))
+    # Stack order is not source order; keep reports stable and readable
+    fstrings.sort()
+    late.sort()
+    return findings
+
+
+def _parse_and_scan(rel: Path) -> GuardFindings | None:
+    src = _parse_one(REPO_ROOT / rel)
+    if src is None:
+        return None
+    return scan_tree(src.tree, may_log_fstring(src.raw))
+
+
+def scan_src_tree_parallel(src_dir: Path = SRC_DIR, processes: int | None = None) -> dict[Path, GuardFindings]:
+    """Parse + scan every module in a process pool, shipping back only the findings.
+
+    Parsing is CPU-bound and holds the GIL, so worker processes scale with
+    cores where the thread pool in parse_src_tree cannot. Pool start-up cost
+    only pays off on full / repeated runs; callers gate it (G6_GUARD_PARALLEL).
+    """
+    files = list_src_files(src_dir)
+    with multiprocessing.Pool(processes=processes or os.cpu_count()) as pool:
+        results = pool.map(_parse_and_scan, files, chunksize=16)
+    return {rel: r for rel, r in zip(files, results, strict=True) if r is not None}
@@ -285,6 +285,32 @@ class TestExpiryServiceClassify:
         
         assert result["is_weekly"] is True
 
+    def test_classify_precomputed_anchor_matches_helper(self):
+        """Test precomputed monthly anchors agree with is_monthly_expiry (incl. out-of-range fallback)."""
+        for dow in (1, 3):
+            service = ExpiryService(today=date(2025, 6, 1), monthly_dow=dow)
+            d = date(2023, 1, 1)
+            while d < date(2032, 1, 1):
+                assert service.classify(d)["is_monthly"] is is_monthly_expiry(d, monthly_dow=dow)
+                d += timedelta(days=1)
+
+    def test_classify_out_of_range_monthly_dow_never_monthly(self):
+        """Test an out-of-range monthly_dow never classifies as monthly (no modulo-7 wrap)."""
+        for dow in (-1, 7):
+            service = ExpiryService(today=date(2025, 6, 1), monthly_dow=dow)
+            d = date(2025, 1, 1)
+            while d < date(2026, 1, 1):
+                assert service.classify(d)["is_monthly"] is False
+                d += timedelta(days=1)
+
+    def test_classify_follows_monthly_dow_change(self):
+        """Test classify() tracks monthly_dow reassigned after construction."""
+        service = ExpiryService(today=date(2025, 6, 1), monthly_dow=3)
+        assert service.classify(date(2025, 10, 30))["is_monthly"] is True  # last Thursday
+        service.monthly_dow = 1
+        assert service.classify(date(2025, 10, 30))["is_monthly"] is False
+        assert service.classify(date(2025, 10, 28))["is_monthly"] is True  # last Tuesday
+
 
 class TestIsWeeklyExpiry:
     """Test is_weekly_expiry function."""
@@ -34,3 +34,16 @@ def test_build_expiry_service_enabled_with_holidays(monkeypatch, tmp_path: Path)
     cands = [dt.date(2025,6,5), dt.date(2025,6,12)]
     picked = svc.select("this_week", cands)
     assert picked == dt.date(2025,6,12)
+
+
+def test_build_expiry_service_holiday_fn_matches_dates(monkeypatch, tmp_path: Path):
+    holi = tmp_path / "holidays.json"
+    holi.write_text(json.dumps(["2025-06-05", "2025-08-15"]))
+    monkeypatch.setenv("G6_EXPIRY_SERVICE", "1")
+    monkeypatch.setenv("G6_HOLIDAYS_FILE", str(holi))
+    svc = build_expiry_service()
+    assert svc is not None and svc.holiday_fn is not None
+    # Public loader still exposes dates; predicate agrees with it
+    for d in load_holiday_calendar(str(holi)):
+        assert svc.holiday_fn(d) is True
+    assert svc.holiday_fn(dt.date(2025,6,6)) is False
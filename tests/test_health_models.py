@@ -1,6 +1,8 @@
 """Tests for health.models module."""
 from __future__ import annotations
 
+from dataclasses import asdict
+
 import pytest
 
 from src.health.models import (
@@ -10,6 +12,8 @@ from src.health.models import (
     CheckHealth,
     HealthResponse,
     level_from_state,
+    status_from_level,
+    worst_level,
 )
 
 
@@ -119,6 +123,33 @@ class TestLevelFromState:
         assert level_from_state(123) == HealthLevel.UNKNOWN  # type: ignore
 
 
+class TestStatusFromLevel:
+    """Test status_from_level inverse mapping."""
+
+    def test_status_from_level_round_trip(self):
+        """Test every level maps to a status that maps back to it."""
+        for level in HealthLevel:
+            assert level_from_state(status_from_level(level)) is level
+
+    def test_status_from_level_out_of_range(self):
+        """Test unmapped values fall back to unknown."""
+        assert status_from_level(99) == "unknown"
+
+
+class TestWorstLevel:
+    """Test worst_level aggregation helper."""
+
+    def test_worst_level_picks_most_severe(self):
+        """Test the highest level wins and an IntEnum is returned."""
+        items = [ComponentHealth("a", "healthy"), CheckHealth("b", "critical"), ComponentHealth("c", "warn")]
+        result = worst_level(items)
+        assert result is HealthLevel.CRITICAL
+
+    def test_worst_level_empty(self):
+        """Test empty input resolves to UNKNOWN."""
+        assert worst_level([]) is HealthLevel.UNKNOWN
+
+
 class TestComponentHealth:
     """Test ComponentHealth dataclass."""
 
@@ -179,6 +210,24 @@ class TestComponentHealth:
         assert ok_component.level == HealthLevel.HEALTHY
         assert error_component.level == HealthLevel.CRITICAL
 
+    def test_component_health_level_tracks_status(self):
+        """Test level reflects status reassigned after construction."""
+        component = ComponentHealth(name="svc", status="healthy")
+        assert component.level is HealthLevel.HEALTHY
+        component.status = "critical"
+        assert component.level is HealthLevel.CRITICAL
+
+    def test_health_records_asdict_fields(self):
+        """Test asdict() emits only the declared record fields."""
+        expected = {"name", "status", "message", "last_check", "details"}
+        assert set(asdict(ComponentHealth(name="svc", status="ok"))) == expected
+        assert set(asdict(CheckHealth(name="chk", status="ok"))) == expected
+
+    def test_component_health_uses_slots(self):
+        """Test records are slotted (no per-instance __dict__)."""
+        assert not hasattr(ComponentHealth(name="svc"), "__dict__")
+        assert not hasattr(CheckHealth(name="chk"), "__dict__")
+
 
 class TestCheckHealth:
     """Test CheckHealth dataclass."""
@@ -324,6 +373,34 @@ class TestHealthResponse:
         assert response.level == HealthLevel.CRITICAL
         assert response.components["database"].message == "Connection lost"
 
+    def test_health_response_aggregate_level(self):
+        """Test aggregate_level spans components and checks."""
+        response = HealthResponse(
+            timestamp="2025-10-27T09:15:00Z",
+            status="warning",
+            level=HealthLevel.WARNING,
+            components={"api": ComponentHealth("api", "degraded")},
+            checks={"disk": CheckHealth("disk", "warning"), "cpu": CheckHealth("cpu", "ok")},
+        )
+        assert response.aggregate_level() is HealthLevel.WARNING
+        empty = HealthResponse(timestamp="t", status="unknown", level=HealthLevel.UNKNOWN)
+        assert empty.aggregate_level() is HealthLevel.UNKNOWN
+
+    def test_health_response_aggregate_level_tracks_mutation(self):
+        """Test aggregate_level reflects records added or replaced after construction."""
+        response = HealthResponse(
+            timestamp="2025-10-27T09:15:00Z",
+            status="healthy",
+            level=HealthLevel.HEALTHY,
+            components={"api": ComponentHealth("api", "ok")},
+        )
+        assert response.aggregate_level() is HealthLevel.HEALTHY
+        response.components["db"] = ComponentHealth("db", "degraded")
+        assert response.aggregate_level() is HealthLevel.DEGRADED
+        response.checks = {"disk": CheckHealth("disk", "critical")}
+        assert response.aggregate_level() is HealthLevel.CRITICAL
+        assert set(asdict(response)) == {"timestamp", "status", "level", "components", "checks"}
+
 
 class TestIntegration:
     """Integration tests across health models."""
@@ -337,18 +414,10 @@ class TestIntegration:
         }
         
         # Determine overall status (worst component level)
-        max_level = max(c.level for c in components.values())
-        status_map = {
-            HealthLevel.HEALTHY: "healthy",
-            HealthLevel.DEGRADED: "degraded",
-            HealthLevel.WARNING: "warning",
-            HealthLevel.CRITICAL: "critical",
-            HealthLevel.UNKNOWN: "unknown",
-        }
-        
+        max_level = worst_level(components.values())
         response = HealthResponse(
             timestamp="2025-10-27T09:15:00Z",
-            status=status_map[max_level],
+            status=status_from_level(max_level),
             level=max_level,
             components=components,
         )
@@ -365,7 +434,7 @@ class TestIntegration:
             "cpu": CheckHealth("cpu", "healthy", "40% utilized"),
         }
         
-        max_level = max(c.level for c in checks.values())
+        max_level = worst_level(checks.values())
         
         response = HealthResponse(
             timestamp="2025-10-27T09:15:00Z",
@@ -405,8 +474,7 @@ class TestIntegration:
         }
         
         # Aggregate all levels
-        all_levels = [c.level for c in components.values()] + [c.level for c in checks.values()]
-        max_level = max(all_levels)
+        max_level = worst_level([*components.values(), *checks.values()])
         
         response = HealthResponse(
             timestamp="2025-10-27T10:00:00Z",
@@ -2,13 +2,28 @@
 from __future__ import annotations
 
 import math
+import subprocess
+import sys
 from datetime import UTC, date, datetime
+from pathlib import Path
 
 import pytest
 
 from src.analytics.option_greeks import OptionGreeks
 
 
+@pytest.fixture(scope="module")
+def calculator():
+    """Shared calculator; OptionGreeks holds no per-call state."""
+    return OptionGreeks()
+
+
+@pytest.fixture(scope="module")
+def atm_1y_20vol(calculator):
+    """Reference ATM call: S=K=100, T=1y, 20% vol, r=5%."""
+    return calculator.black_scholes(is_call=True, S=100.0, K=100.0, T=1.0, sigma=0.20, r=0.05)
+
+
 class TestCalculateDTE:
     """Test _calculate_dte method for days-to-expiry calculation."""
 
@@ -78,95 +93,70 @@ class TestCalculateDTE:
         # Exactly 24 hours = 1 day
         assert 0.0027 < dte < 0.0028  # 1/365 = 0.00274
 
+    def test_calculate_dte_vec_matches_scalar(self):
+        """Test the vectorized DTE agrees with the scalar one for date and datetime inputs."""
+        pytest.importorskip("numpy")
+        expiries = [date(2025, 10, 20), date(2025, 10, 27), date(2025, 11, 27)]
+        for current in (date(2025, 10, 27), datetime(2025, 10, 27, 9, 0, 0, tzinfo=UTC)):
+            dte = OptionGreeks._calculate_dte_vec(expiries, current)
+            expected = [OptionGreeks._calculate_dte(e, current) for e in expiries]
+            assert list(dte) == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+        mixed = [date(2025, 11, 27), datetime(2025, 11, 3, 15, 30, 0, tzinfo=UTC)]
+        dte = OptionGreeks._calculate_dte_vec(mixed, date(2025, 10, 27))
+        assert list(dte) == [OptionGreeks._calculate_dte(e, date(2025, 10, 27)) for e in mixed]
+
+    def test_calculate_dte_cached_per_pair(self):
+        """Test repeated (expiry, current) datetime pairs are memoised independent of instance flags."""
+        from src.analytics import option_greeks
+
+        option_greeks._cached_dte.cache_clear()
+        expiry = date(2025, 11, 27)
+        current = datetime(2025, 10, 27, 12, 0, 0)
+
+        first = OptionGreeks()._calculate_dte(expiry, current)
+        again = OptionGreeks(use_actual_dte=False)._calculate_dte(expiry, current)
+
+        assert again == first
+        info = option_greeks._cached_dte.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_calculate_dte_date_fast_path_matches_general(self):
+        """Test the date/date ordinal fast path keeps the 15:30 UTC expiry convention."""
+        from src.analytics import option_greeks
+
+        current = date(2025, 10, 27)
+        for expiry in (date(2025, 10, 20), date(2025, 10, 26), current, date(2025, 11, 27)):
+            assert OptionGreeks._calculate_dte(expiry, current) == pytest.approx(
+                option_greeks._compute_dte(expiry, current), rel=1e-12, abs=0.0
+            )
+        assert OptionGreeks._calculate_dte(current, current) == pytest.approx(15.5 / 24 / 365)
+
 
 class TestBlackScholes:
     """Test Black-Scholes option pricing."""
 
-    def test_black_scholes_call_basic(self):
-        """Test basic Black-Scholes call option pricing."""
-        calculator = OptionGreeks()
-        
-        result = calculator.black_scholes(
-            is_call=True,
-            S=100.0,
-            K=100.0,
-            T=1.0,  # 1 year
-            sigma=0.20,  # 20% vol
-            r=0.05
-        )
-        
-        # ATM call with 1 year should have positive price
-        assert result["price"] > 0
-        assert 5.0 < result["price"] < 15.0  # Reasonable range
-        
-        # Greeks should be in expected ranges
-        assert 0.4 < result["delta"] < 0.7  # ATM delta ~0.5
+    @pytest.mark.parametrize(
+        "is_call, S, T, price_range, delta_range",
+        [
+            pytest.param(True, 100.0, 1.0, (5.0, 15.0), (0.4, 0.7), id="call_atm"),
+            pytest.param(False, 100.0, 1.0, (5.0, 15.0), (-0.7, -0.3), id="put_atm"),
+            pytest.param(True, 110.0, 0.5, (10.0, math.inf), (0.7, math.inf), id="call_itm"),
+            pytest.param(False, 110.0, 0.5, (0.0, 5.0), (-0.3, 0.0), id="put_otm"),
+        ],
+    )
+    def test_black_scholes_basic(self, calculator, is_call, S, T, price_range, delta_range):
+        """Test price/delta ranges and greek signs across moneyness for calls and puts (K=100)."""
+        result = calculator.black_scholes(is_call=is_call, S=S, K=100.0, T=T, sigma=0.20, r=0.05)
+
+        assert price_range[0] < result["price"] < price_range[1]
+        assert delta_range[0] < result["delta"] < delta_range[1]
         assert result["gamma"] > 0
         assert result["vega"] > 0
         assert result["theta"] < 0  # Time decay
 
-    def test_black_scholes_put_basic(self):
-        """Test basic Black-Scholes put option pricing."""
-        calculator = OptionGreeks()
-        
-        result = calculator.black_scholes(
-            is_call=False,
-            S=100.0,
-            K=100.0,
-            T=1.0,
-            sigma=0.20,
-            r=0.05
-        )
-        
-        # ATM put with 1 year should have positive price
-        assert result["price"] > 0
-        assert 5.0 < result["price"] < 15.0
-        
-        # Put delta should be negative
-        assert -0.7 < result["delta"] < -0.3
-        assert result["gamma"] > 0
-        assert result["vega"] > 0
-        assert result["theta"] < 0
-
-    def test_black_scholes_itm_call(self):
-        """Test in-the-money call option."""
-        calculator = OptionGreeks()
-        
-        result = calculator.black_scholes(
-            is_call=True,
-            S=110.0,  # 10% ITM
-            K=100.0,
-            T=0.5,  # 6 months
-            sigma=0.20,
-            r=0.05
-        )
-        
-        # ITM call should have higher price
-        assert result["price"] > 10.0
-        # ITM call should have high delta
-        assert result["delta"] > 0.7
-
-    def test_black_scholes_otm_put(self):
-        """Test out-of-the-money put option."""
-        calculator = OptionGreeks()
-        
-        result = calculator.black_scholes(
-            is_call=False,
-            S=110.0,
-            K=100.0,  # OTM put (S > K)
-            T=0.5,
-            sigma=0.20,
-            r=0.05
-        )
-        
-        # OTM put should have lower price
-        assert 0 < result["price"] < 5.0
-        # OTM put should have lower delta magnitude
-        assert -0.3 < result["delta"] < 0
-
-    def test_black_scholes_with_date_expiry(self):
+    def test_black_scholes_with_date_expiry(self, calculator):
         """Test Black-Scholes with date object for expiry."""
-        calculator = OptionGreeks()
         current = date(2025, 10, 27)
         expiry = date(2025, 11, 27)  # 31 days ahead
         
@@ -184,10 +174,8 @@ class TestBlackScholes:
         assert result["price"] > 0
         assert 1.0 < result["price"] < 5.0  # Shorter term
 
-    def test_black_scholes_zero_dte(self):
+    def test_black_scholes_zero_dte(self, calculator):
         """Test Black-Scholes with zero DTE (expired)."""
-        calculator = OptionGreeks()
-        
         result = calculator.black_scholes(
             is_call=True,
             S=105.0,
@@ -204,10 +192,8 @@ class TestBlackScholes:
         assert result["theta"] == 0.0
         assert result["vega"] == 0.0
 
-    def test_black_scholes_zero_volatility(self):
+    def test_black_scholes_zero_volatility(self, calculator):
         """Test Black-Scholes with zero volatility."""
-        calculator = OptionGreeks()
-        
         result = calculator.black_scholes(
             is_call=True,
             S=105.0,
@@ -221,10 +207,16 @@ class TestBlackScholes:
         assert result["price"] == 5.0
         assert result["delta"] == 1.0
 
-    def test_black_scholes_with_dividend(self):
+    def test_black_scholes_sub_resolution_inputs(self, calculator):
+        """Test T or sigma too small to survive cache rounding take the intrinsic path, not NaN."""
+        for T, sigma in [(1e-12, 0.20), (1.0, 1e-12)]:
+            for is_call, K in [(True, 100.0), (True, 95.0), (False, 110.0)]:
+                result = calculator.black_scholes(is_call=is_call, S=100.0, K=K, T=T, sigma=sigma, r=0.05)
+                assert all(math.isfinite(v) for v in result)
+                assert result == calculator._intrinsic_value(is_call, 100.0, K)
+
+    def test_black_scholes_with_dividend(self, calculator, atm_1y_20vol):
         """Test Black-Scholes with dividend yield."""
-        calculator = OptionGreeks()
-        
         result = calculator.black_scholes(
             is_call=True,
             S=100.0,
@@ -236,22 +228,10 @@ class TestBlackScholes:
         )
         
         # Dividend reduces call price
-        result_no_div = calculator.black_scholes(
-            is_call=True,
-            S=100.0,
-            K=100.0,
-            T=1.0,
-            sigma=0.20,
-            r=0.05,
-            q=0.0
-        )
-        
-        assert result["price"] < result_no_div["price"]
+        assert result["price"] < atm_1y_20vol["price"]
 
-    def test_black_scholes_high_volatility(self):
+    def test_black_scholes_high_volatility(self, calculator, atm_1y_20vol):
         """Test Black-Scholes with high volatility."""
-        calculator = OptionGreeks()
-        
         result = calculator.black_scholes(
             is_call=True,
             S=100.0,
@@ -262,16 +242,7 @@ class TestBlackScholes:
         )
         
         # Higher vol -> higher option price and vega
-        result_low_vol = calculator.black_scholes(
-            is_call=True,
-            S=100.0,
-            K=100.0,
-            T=1.0,
-            sigma=0.20,
-            r=0.05
-        )
-        
-        assert result["price"] > result_low_vol["price"]
+        assert result["price"] > atm_1y_20vol["price"]
         assert result["vega"] > 0
 
     def test_black_scholes_custom_risk_free_rate(self):
@@ -290,10 +261,8 @@ class TestBlackScholes:
         # Higher r -> higher call price
         assert result["price"] > 0
 
-    def test_black_scholes_exception_handling(self):
+    def test_black_scholes_exception_handling(self, calculator):
         """Test Black-Scholes handles calculation errors gracefully."""
-        calculator = OptionGreeks()
-        
         # Invalid inputs that could cause math errors
         result = calculator.black_scholes(
             is_call=True,
@@ -308,6 +277,141 @@ class TestBlackScholes:
         assert result["price"] == 0.0
         assert result["delta"] == 0.0
 
+    def test_black_scholes_kernel_jit_matches_python(self):
+        """Test the (optionally Numba-compiled) kernel agrees with its pure-Python source."""
+        from src.analytics import option_greeks
+
+        kernel = option_greeks._kernels().bs_kernel
+        py_kernel = option_greeks._bs_kernel
+        for args in [(True, 100.0, 100.0, 1.0, 0.2, 0.05, 0.0), (False, 95.0, 110.0, 0.1, 0.35, 0.07, 0.01)]:
+            assert kernel(*args) == pytest.approx(py_kernel(*args), rel=1e-9, abs=1e-12)
+        # Near-degenerate inputs: huge |d1|, CDF/pdf tails saturating at 0/1 and
+        # extreme S/K, where value-unsafe fast-math would be free to diverge
+        for args in [
+            (True, 100.0, 100.0, 1e-12, 0.2, 0.05, 0.0),
+            (False, 100.0, 100.0, 1.0, 1e-12, 0.05, 0.0),
+            (True, 1e300, 1e-300, 1.0, 0.2, 0.05, 0.0),
+            (False, 1e-150, 1e150, 50.0, 1e3, -0.05, 0.01),
+            (True, 100.0, 100.0, 1e-300, 1e-6, 0.05, 0.0),
+        ]:
+            assert kernel(*args) == pytest.approx(py_kernel(*args), rel=1e-9, abs=1e-12, nan_ok=True)
+
+    def test_black_scholes_kernels_compiled_on_first_use(self):
+        """Test importing the module compiles nothing; the first price resolves the kernels."""
+        code = (
+            "from src.analytics import option_greeks as og\n"
+            "assert og._KERNELS is None\n"
+            "og.OptionGreeks().black_scholes(True, 100.0, 100.0, 1.0, sigma=0.2)\n"
+            "assert og._KERNELS is not None\n"
+        )
+        repo_root = Path(__file__).resolve().parents[1]
+        proc = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+
+    def test_black_scholes_theta_matches_time_decay(self, calculator):
+        """Test theta (per day) equals the finite-difference price decay for calls and puts."""
+        h = 1e-5
+        for is_call in (True, False):
+            result = calculator.black_scholes(is_call=is_call, S=100.0, K=100.0, T=1.0, sigma=0.2, r=0.05, q=0.02)
+            shorter = calculator.black_scholes(is_call=is_call, S=100.0, K=100.0, T=1.0 - h, sigma=0.2, r=0.05, q=0.02)
+            longer = calculator.black_scholes(is_call=is_call, S=100.0, K=100.0, T=1.0 + h, sigma=0.2, r=0.05, q=0.02)
+            fd_theta = (shorter["price"] - longer["price"]) / (2 * h) / 365.0
+            assert result["theta"] == pytest.approx(fd_theta, rel=1e-4)
+
+    def test_black_scholes_given_precomputed_matches_kernel(self):
+        """Test the IV solver's precomputed-term pricer agrees with the full kernel."""
+        from src.analytics.option_greeks import _bs_given_precomputed, _bs_kernel, _precompute
+
+        S, K, T, sigma, r, q = 100.0, 95.0, 0.4, 0.3, 0.06, 0.02
+        terms = _precompute(S, K, T, r, q)
+        for is_call in (True, False):
+            price, delta, gamma, theta, vega, rho = _bs_kernel(is_call, S, K, T, sigma, r, q)
+            assert _bs_given_precomputed(is_call, S, K, sigma, *terms) == pytest.approx((price, vega * 100), rel=1e-9)
+
+    def test_black_scholes_cached_results_are_immutable(self, calculator):
+        """Test repeated calls hit the kernel cache and the shared result cannot be mutated."""
+        from src.analytics import option_greeks
+
+        calculator.black_scholes.cache_clear()
+
+        first = calculator.black_scholes(is_call=True, S=100.0, K=100.0, T=1.0, sigma=0.2, r=0.05)
+        with pytest.raises(TypeError):
+            first["price"] = -1.0  # type: ignore[index]
+        second = calculator.black_scholes(is_call=True, S=100.0 + 1e-12, K=100.0, T=1.0, sigma=0.2, r=0.05)
+
+        assert second["price"] == pytest.approx(10.4506, abs=1e-4)
+        info = option_greeks._bs_core.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_black_scholes_returns_greeks_tuple(self, calculator):
+        """Test result supports attribute, str-key, int-index and mapping-style access."""
+        from src.analytics.option_greeks import Greeks
+
+        result = calculator.black_scholes(is_call=True, S=100.0, K=100.0, T=1.0, sigma=0.2, r=0.05)
+
+        assert isinstance(result, Greeks)
+        assert result.price == result["price"] == result[0]
+        assert result.get("vega") == result.vega
+        assert result.get("iv", 0) == 0
+        assert list(result.keys()) == ["price", "delta", "gamma", "theta", "vega", "rho"]
+        assert dict(result.items()) == result._asdict()
+        with pytest.raises(KeyError):
+            result["iv"]
+
+
+class TestBlackScholesVec:
+    """Test vectorized Black-Scholes against the scalar path."""
+
+    def test_black_scholes_vec_matches_scalar(self):
+        """Test each array element equals the scalar result (incl. expired/invalid rows)."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        is_call = np.array([True, False, True, False, True, False, True])
+        S = np.array([100.0, 100.0, 110.0, 110.0, 105.0, 95.0, -100.0])
+        K = np.full(7, 100.0)
+        T = np.array([1.0, 1.0, 0.5, 0.5, 0.0, 1.0, 1.0])
+        sigma = np.array([0.20, 0.20, 0.30, 0.30, 0.20, 0.0, 0.20])
+
+        result = calculator.black_scholes_vec(is_call, S, K, T, r=0.05, sigma=sigma, q=0.01)
+
+        for i in range(len(S)):
+            expected = calculator.black_scholes(
+                is_call=bool(is_call[i]), S=S[i], K=K[i], T=T[i], r=0.05, sigma=sigma[i], q=0.01
+            )
+            for key, value in expected.items():
+                assert result[key][i] == pytest.approx(value, abs=1e-10)
+
+    def test_black_scholes_vec_broadcasts_scalars(self):
+        """Test scalar spot/sigma broadcast across a strike array."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        strikes = np.array([90.0, 100.0, 110.0])
+
+        result = calculator.black_scholes_vec(True, 100.0, strikes, 1.0, r=0.05, sigma=0.2)
+
+        assert result["price"].shape == (3,)
+        assert result["delta"][0] > result["delta"][1] > result["delta"][2]
+
+    def test_greeks_chain_columns_and_rows(self):
+        """Test the SoA chain round-trips with per-strike Greeks rows."""
+        np = pytest.importorskip("numpy")
+        from src.analytics.option_greeks import GreeksChain
+
+        calculator = OptionGreeks()
+        strikes = [90.0, 100.0, 110.0]
+        rows = [calculator.black_scholes(is_call=True, S=100.0, K=k, T=1.0, sigma=0.2, r=0.05) for k in strikes]
+
+        chain = calculator.black_scholes_vec(True, 100.0, np.array(strikes), 1.0, r=0.05, sigma=0.2)
+        from_rows = GreeksChain.from_scalar_list(rows)
+
+        assert isinstance(chain, GreeksChain)
+        assert len(chain) == len(from_rows) == 3
+        assert chain.delta.sum() == pytest.approx(sum(g.delta for g in rows))
+        for i, row in enumerate(rows):
+            assert tuple(chain[i]) == pytest.approx(tuple(row), abs=1e-10)
+            assert from_rows[i] == row
+        assert len(GreeksChain.from_scalar_list([])) == 0
+
 
 class TestIntrinsicValue:
     """Test intrinsic value calculation for expired options."""
@@ -369,6 +473,18 @@ class TestIntrinsicValue:
         assert result["price"] == 0.0
         assert result["delta"] == 0.0
 
+    def test_intrinsic_value_vec_matches_scalar(self):
+        """Test the array overload agrees with the scalar one across a mixed chain."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        is_call = np.array([True, True, True, False, False, False])
+        K = np.array([90.0, 100.0, 110.0, 90.0, 100.0, 110.0])
+
+        result = calculator._intrinsic_value_vec(is_call, 100.0, K)
+
+        for i in range(len(K)):
+            assert result[i] == calculator._intrinsic_value(bool(is_call[i]), 100.0, K[i])
+
 
 class TestImpliedVolatility:
     """Test implied volatility calculation."""
@@ -608,6 +724,106 @@ class TestImpliedVolatility:
         # Should recover ~22% vol
         assert 0.20 < iv < 0.24
 
+    def test_implied_volatility_initial_guess_close(self):
+        """Test Corrado-Miller seed lands near the true vol so Newton only polishes."""
+        calculator = OptionGreeks()
+
+        for is_call, K, sigma in [(True, 100.0, 0.25), (False, 100.0, 0.40), (True, 115.0, 0.20), (False, 85.0, 0.30)]:
+            price = calculator.black_scholes(is_call=is_call, S=100.0, K=K, T=0.5, sigma=sigma, r=0.05)["price"]
+            guess = OptionGreeks._iv_initial_guess(is_call, 100.0, K, 0.5, price, 0.05, 0.0)
+            assert guess == pytest.approx(sigma, abs=0.03)
+
+            iv, iterations = calculator.implied_volatility(
+                is_call=is_call, S=100.0, K=K, T=0.5, market_price=price, r=0.05, return_iterations=True
+            )
+            assert iv == pytest.approx(sigma, abs=1e-4)
+            assert iterations <= 5
+
+    def test_implied_volatility_brent_fallback_on_flat_vega(self, monkeypatch):
+        """Test a seed with vanishing vega (deep OTM at min_iv) is rescued by the Brent fallback."""
+        calculator = OptionGreeks()
+        price = calculator.black_scholes(is_call=True, S=100.0, K=150.0, T=0.25, sigma=0.60, r=0.05)["price"]
+        monkeypatch.setattr(OptionGreeks, "_iv_initial_guess", staticmethod(lambda *args: 0.01))
+
+        iv, iterations = calculator.implied_volatility(
+            is_call=True, S=100.0, K=150.0, T=0.25, market_price=price, r=0.05, return_iterations=True
+        )
+
+        assert iv == pytest.approx(0.60, abs=1e-4)
+        assert iterations <= 100
+
+    def test_brentq_fallback_port(self, monkeypatch):
+        """Test the in-module Brent port finds bracketed roots and rejects non-brackets."""
+        from src.analytics import option_greeks
+
+        monkeypatch.setattr(option_greeks, "_scipy_brentq", None)
+        root, iterations = option_greeks._brentq(lambda x: x * x - 2.0, 0.0, 2.0, 1e-12, 100)
+        assert root == pytest.approx(math.sqrt(2.0), abs=1e-11)
+        assert 0 < iterations < 100
+        with pytest.raises(ValueError):
+            option_greeks._brentq(lambda x: x * x + 1.0, 0.0, 2.0, 1e-12, 100)
+
+    def test_implied_volatility_vec_matches_scalar(self):
+        """Test batched IV agrees with the scalar solver element-wise."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        is_call = np.array([True, False, True, False, True, True])
+        K = np.array([100.0, 100.0, 120.0, 80.0, 100.0, 100.0])
+        T = np.array([1.0, 0.5, 0.25, 0.1, 0.0, 1.0])
+        sigma = np.array([0.20, 0.35, 0.25, 0.60, 0.20, 0.20])
+        prices = np.array([
+            calculator.black_scholes(is_call=bool(is_call[i]), S=100.0, K=K[i], T=T[i], r=0.05, sigma=sigma[i])["price"]
+            for i in range(len(K))
+        ])
+        prices[-1] = 0.005  # below the 0.01 floor -> min_iv
+
+        ivs = calculator.implied_volatility_vec(is_call, 100.0, K, T, prices, r=0.05)
+
+        for i in range(len(K)):
+            expected = calculator.implied_volatility(
+                is_call=bool(is_call[i]), S=100.0, K=K[i], T=T[i], market_price=prices[i], r=0.05
+            )
+            assert ivs[i] == pytest.approx(expected, abs=1e-6)
+        assert ivs[:4] == pytest.approx(sigma[:4], abs=1e-4)
+
+    def test_implied_volatility_vec_matches_scalar_across_chain(self):
+        """Test batched IV agrees with the scalar solver over a wide random chain (incl. stalled rows)."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        rng = np.random.default_rng(0)
+        n = 2000
+        is_call = rng.random(n) < 0.5
+        K = rng.uniform(60.0, 160.0, n)
+        T = rng.uniform(0.01, 1.0, n)
+        sigma = rng.uniform(0.05, 1.5, n)
+        prices = calculator.black_scholes_vec(is_call, 100.0, K, T, 0.05, sigma).price
+
+        ivs = calculator.implied_volatility_vec(is_call, 100.0, K, T, prices, r=0.05)
+
+        expected = [
+            calculator.implied_volatility(bool(c), 100.0, k, t, p, r=0.05)
+            for c, k, t, p in zip(is_call, K, T, prices, strict=True)
+        ]
+        assert ivs == pytest.approx(np.array(expected), abs=1e-6)
+
+    def test_implied_volatility_vec_brent_fallback_on_low_vega(self):
+        """Test cheap deep-OTM rows whose Newton steps stall on tiny vega finish like the scalar solver."""
+        np = pytest.importorskip("numpy")
+        calculator = OptionGreeks()
+        K = np.array([143.48, 149.52, 140.58, 141.66, 154.22])
+        T = np.array([0.1, 0.051, 0.059, 0.345, 0.837])
+        prices = np.array([0.01204, 0.013155, 0.012543, 0.011847, 0.012587])
+
+        ivs = calculator.implied_volatility_vec(True, 100.0, K, T, prices, r=0.05)
+
+        for i in range(len(K)):
+            expected = calculator.implied_volatility(
+                is_call=True, S=100.0, K=K[i], T=T[i], market_price=prices[i], r=0.05
+            )
+            assert ivs[i] == pytest.approx(expected, abs=1e-6)
+            repriced = calculator.black_scholes(is_call=True, S=100.0, K=K[i], T=T[i], r=0.05, sigma=ivs[i])["price"]
+            assert repriced == pytest.approx(prices[i], abs=1e-5)
+
 
 class TestIntegration:
     """Integration tests across option pricing functionality."""
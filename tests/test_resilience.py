@@ -9,7 +9,7 @@ from src.utils.resilience import retry, fallback, timeout
 def test_retry_succeeds_after_failures():
     calls = {"n": 0}
 
-    @retry(max_attempts=3, delay=0.01, backoff_factor=1.0, jitter=False)
+    @retry(max_attempts=3, delay=0.001, backoff_factor=1.0, jitter=False)
     def flaky():
         calls["n"] += 1
         if calls["n"] < 3:
@@ -29,8 +29,10 @@ def test_fallback_returns_default():
 
 
 def test_timeout_raises():
-    @timeout(0.05)
+    @timeout(0.02)
     def slow():
+        # Must outlast timeout + the decorator's 0.1s join buffer; the test itself
+        # only waits for the join, the sleeping worker finishes in the background.
         time.sleep(0.2)
         return "done"
 
@@ -1,6 +1,9 @@
 """Tests for utils.symbol_utils module."""
 from __future__ import annotations
 
+import json
+import sys
+
 import pytest
 
 from src.utils.symbol_utils import (
@@ -10,8 +13,15 @@ from src.utils.symbol_utils import (
     get_strike_step,
     get_display_name,
     INDEX_INFO,
+    _NORMALIZED,
+    _build_root_dispatch,
+    _match_root,
+    _normalized_view,
 )
 
+# Session-scoped warm-up of the normalize_symbol / get_* caches (see conftest).
+pytestmark = pytest.mark.usefixtures("warm_symbol_cache")
+
 
 class TestIndexInfo:
     """Test INDEX_INFO configuration."""
@@ -58,6 +68,13 @@ class TestIndexInfo:
         assert info["segment"] == "BFO-OPT"
         assert info["exchange"] == "BSE"
 
+    def test_index_info_read_only(self):
+        """Test INDEX_INFO and its entries reject mutation."""
+        with pytest.raises(TypeError):
+            INDEX_INFO["NEW"] = INDEX_INFO["NIFTY"]  # type: ignore[index]
+        with pytest.raises(TypeError):
+            INDEX_INFO["NIFTY"]["strike_step"] = 1  # type: ignore[index]
+
 
 class TestNormalizeSymbol:
     """Test normalize_symbol function."""
@@ -124,6 +141,11 @@ class TestNormalizeSymbol:
         assert result["segment"] == "NFO-OPT"
         assert result["exchange"] == "NSE"
 
+    def test_normalize_whitespace_only_is_empty(self):
+        """Test whitespace-only input shares the empty-symbol result."""
+        assert _normalized_view("   ") is _normalized_view("")
+        assert normalize_symbol("\t\n")["root"] == "UNKNOWN"
+
     def test_normalize_unknown_symbol(self):
         """Test normalizing unknown symbol returns defaults."""
         result = normalize_symbol("UNKNOWN_INDEX")
@@ -397,3 +419,45 @@ class TestIntegration:
         assert get_exchange(symbol) == norm["exchange"]
         assert get_strike_step(symbol) == norm["strike_step"]
         assert get_display_name(symbol) == norm["display"]
+
+    def test_root_dispatch_matches_startswith_scan(self):
+        """Test the generated root dispatch agrees with a plain startswith() scan over INDEX_INFO."""
+        symbols = ["NIFTY", "NIFTY24DEC", "NIFT", "BANKNIFTY2024", "BANK", "FINNIFTYX", "MIDCP", "SENSEX50", "X", ""]
+        for symbol in symbols:
+            expected = next((key for key in INDEX_INFO if symbol.startswith(key)), None)
+            assert _match_root(symbol) is (_NORMALIZED[expected] if expected else None)
+
+    def test_root_dispatch_prefers_longest_root(self):
+        """Test roots sharing a first character are tried longest first."""
+        match = _build_root_dispatch({"NI": {"root": "NI"}, "NIFTY": {"root": "NIFTY"}, "X": {"root": "X"}})
+        assert match("NIFTY24")["root"] == "NIFTY"
+        assert match("NIX")["root"] == "NI"
+        assert match("XYZ")["root"] == "X"
+        assert match("N") is None
+
+    def test_normalize_symbol_returns_private_dict(self):
+        """Test each call returns its own plain dict; mutating it leaves the memoised result intact."""
+        first = normalize_symbol("NIFTY")
+
+        assert isinstance(first, dict)
+        assert json.loads(json.dumps(first)) == first
+        first["root"] = "BANKNIFTY"
+        assert normalize_symbol("NIFTY")["root"] == "NIFTY"
+        assert normalize_symbol("NIFTY") is not normalize_symbol("NIFTY")
+
+    def test_memoised_view_read_only(self):
+        """Test the cached view behind normalize_symbol is shared and rejects mutation."""
+        view = _normalized_view("NIFTY")
+
+        assert _normalized_view("NIFTY") is view
+        with pytest.raises(TypeError):
+            view["root"] = "BANKNIFTY"  # type: ignore[index]
+
+    def test_known_roots_share_precomputed_result(self):
+        """Test decorated and exact spellings of a root resolve to the same precomputed view."""
+        assert _normalized_view("BANKNIFTY2024") is _normalized_view(" banknifty ")
+
+    def test_normalized_roots_are_interned(self):
+        """Test canonical roots are interned strings (identity-equal across call sites)."""
+        assert normalize_symbol("nifty24dec")["root"] is sys.intern("NIFTY")
+        assert normalize_symbol("custom_idx")["root"] is sys.intern("CUSTOM_IDX")
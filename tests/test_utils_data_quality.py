@@ -1,9 +1,26 @@
 """Tests for data quality utilities."""
 from __future__ import annotations
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
-from src.utils.data_quality import DataQualityChecker
+from src.utils.data_quality import DataQualityChecker, Issue, IssueList, OptionQuote
+
+
+def _option_row(**overrides):
+    """A valid CE option record, with any field replaced by overrides."""
+    row = {
+        'strike': 18000.0,
+        'instrument_type': 'CE',
+        'last_price': 150.5,
+        'expiry': '2025-10-31',
+        'tradingsymbol': 'X',
+    }
+    row.update(overrides)
+    return row
 
 
 class TestDataQualityChecker:
@@ -106,6 +123,21 @@ class TestDataQualityChecker:
         assert 'NIFTY25OCT18000CE' not in valid_data
         assert any('Invalid price' in issue for issue in issues)
     
+    def test_validate_options_data_non_finite_values(self, checker):
+        """Test NaN / inf prices and strikes are rejected, non-finite volume flagged."""
+        options_data = {
+            'A': _option_row(last_price=float('nan')),
+            'B': _option_row(strike=float('inf')),
+            'C': _option_row(volume=float('nan'), last_price='12.5'),
+        }
+        valid_data, issues = checker.validate_options_data(options_data)
+        assert list(valid_data) == ['C']
+        assert issues == [
+            "Invalid price for A: nan",
+            "Invalid strike for B: inf",
+            "Invalid volume for C: nan",
+        ]
+
     def test_validate_options_data_invalid_strike(self, checker):
         """Test validation with invalid strike."""
         options_data = {
@@ -155,6 +187,90 @@ class TestDataQualityChecker:
         assert 'NIFTY25OCT18000CE' in valid_data
         assert any('Negative OI' in issue for issue in issues)
     
+    def test_validate_options_data_mixed_chain_order(self, checker):
+        """Test issues keep row order and check precedence across a mixed chain."""
+        options_data = {
+            'A': _option_row(volume=-1, oi='bad'),
+            'B': 'not a dict',
+            'C': _option_row(instrument_type='FUT', last_price=-1),
+            'D': _option_row(last_price=-2, strike='bad'),
+            'E': _option_row(last_price='bad'),
+            'F': _option_row(strike=0),
+            'G': _option_row(last_price=5000.0, open_interest=-3, oi=7, volume=None),
+            'H': _option_row(),
+        }
+        valid_data, issues = checker.validate_options_data(options_data)
+        assert list(valid_data) == ['A', 'G', 'H']
+        assert issues == [
+            "Negative volume for A: -1.0",
+            "Invalid OI for A: bad",
+            "Invalid data format for B",
+            "Invalid instrument_type for C: FUT",
+            "Negative price for D: -2.0",
+            "Invalid price for E: bad",
+            "Invalid strike for F: 0.0",
+            "Negative OI for G: -3.0",
+            "Price outlier detected for G: 5000.0",
+        ]
+
+    def test_validate_options_data_issue_flags(self, checker):
+        """Test the issue list carries an Issue mask of every kind reported."""
+        _, issues = checker.validate_options_data({})
+        assert isinstance(issues, IssueList)
+        assert issues.flags == Issue.EMPTY
+
+        base = _option_row()
+        options_data = {
+            'A': _option_row(volume=-1),
+            'B': _option_row(last_price=-5),
+            'C': base,
+        }
+        valid_data, issues = checker.validate_options_data(options_data)
+        assert list(valid_data) == ['A', 'C']
+        assert issues.flags == Issue.NEGATIVE_VOLUME | Issue.NEGATIVE_PRICE
+        assert not issues.flags & Issue.NEGATIVE_OI
+
+        _, issues = checker.validate_options_data({'C': base})
+        assert issues == [] and not issues.flags
+
+    def test_validate_options_data_codes_without_messages(self, checker):
+        """Test messages=False skips formatting but keeps per-issue codes."""
+        options_data = {
+            'A': 'bad',
+            'B': {'strike': 100.0, 'instrument_type': 'CE', 'last_price': 50.0,
+                  'expiry': 'e', 'tradingsymbol': 'B', 'volume': -1},
+        }
+        valid_data, issues = checker.validate_options_data(options_data, messages=False)
+        assert list(valid_data) == ['B']
+        assert issues == []
+        assert list(issues.codes) == [Issue.INVALID_FORMAT, Issue.NEGATIVE_VOLUME, Issue.PRICE_OUTLIER]
+
+        _, full = checker.validate_options_data(options_data)
+        assert full.codes == issues.codes and full.flags == issues.flags
+        assert len(full) == len(full.codes)
+
+        _, empty = checker.validate_options_data({}, messages=False)
+        assert empty == [] and list(empty.codes) == [Issue.EMPTY]
+
+    def test_validate_options_data_typed_matches_dict(self, checker):
+        """Test OptionQuote rows give the same result as the equivalent dicts."""
+        rows = {
+            'A': {'strike': 100.0, 'instrument_type': 'CE', 'last_price': 50.0,
+                  'expiry': 'e', 'tradingsymbol': 'A', 'open_interest': 'x', 'oi': 5},
+            'B': {'strike': 100.0, 'instrument_type': 'XX', 'last_price': 1.0,
+                  'expiry': 'e', 'tradingsymbol': 'B'},
+            'C': {'strike': 100.0, 'instrument_type': 'PE', 'last_price': 1.0,
+                  'expiry': 'e', 'tradingsymbol': 'C', 'volume': -2},
+        }
+        quotes = {k: OptionQuote.from_dict(v) for k, v in rows.items()}
+        assert quotes['A'].oi == 'x'
+
+        valid_dict, issues_dict = checker.validate_options_data(rows)
+        valid_typed, issues_typed = checker.validate_options_data_typed({**quotes, 'D': rows['C']})
+        assert list(valid_typed) == list(valid_dict) == ['A', 'C']
+        assert issues_typed == issues_dict + ["Invalid data format for D"]
+        assert issues_typed.flags == issues_dict.flags | Issue.INVALID_FORMAT
+
     def test_is_price_outlier_normal(self, checker):
         """Test outlier detection with normal price."""
         option_data = {
@@ -171,6 +287,13 @@ class TestDataQualityChecker:
         }
         assert checker.is_price_outlier(option_data)
     
+    def test_is_price_outlier_scalar(self, checker):
+        """Test the scalar predicate matches the dict form and honours ratio."""
+        assert not DataQualityChecker.is_price_outlier_scalar(18000.0, 3600.0)
+        assert DataQualityChecker.is_price_outlier_scalar(18000.0, 3600.5)
+        assert checker.is_price_outlier_scalar(100.0, 30.0, ratio=0.25)
+        assert not checker.is_price_outlier({'strike': 18000.0, 'last_price': 3600.0})
+
     def test_check_expiry_consistency_empty(self, checker):
         """Test expiry consistency with empty data."""
         issues = checker.check_expiry_consistency({})
@@ -228,6 +351,21 @@ class TestDataQualityChecker:
         assert 'monthly_ce_price_static' in issues
         assert 'monthly_pe_price_static' in issues
     
+    def test_check_expiry_consistency_monthly_diverse_prices(self, checker):
+        """Test a third distinct (2dp) price clears the static flag; two do not."""
+        options_data = {
+            'CE1': {'last_price': 100.0, 'instrument_type': 'CE'},
+            'CE2': {'last_price': 100.001, 'instrument_type': 'CE'},
+            'CE3': {'last_price': 101.0, 'instrument_type': 'CE'},
+            'CE4': {'last_price': 102.0, 'instrument_type': 'CE'},
+            'PE1': {'last_price': 200.0, 'instrument_type': 'PE'},
+            'PE2': {'last_price': 201.0, 'instrument_type': 'PE'},
+            'PE3': {'last_price': 200.004, 'instrument_type': 'PE'},
+        }
+        issues = checker.check_expiry_consistency(options_data, expiry_rule='monthly')
+        assert 'monthly_ce_price_static' not in issues
+        assert 'monthly_pe_price_static' in issues
+
     def test_validate_index_data_valid(self, checker):
         """Test index data validation with valid data."""
         is_valid, issues = checker.validate_index_data(18000.0)
@@ -350,6 +488,19 @@ class TestDataQualityChecker:
         assert 'pcr' in stats
         assert stats['pcr'] == 4500.0 / 2500.0  # put_oi / call_oi
     
+    def test_get_statistics_skips_other_instruments(self, checker):
+        """Test non CE/PE rows count towards total only and PCR uses OI totals."""
+        options_data = {
+            'CE1': {'instrument_type': 'CE', 'last_price': 10, 'oi': 100, 'volume': 1},
+            'FUT': {'instrument_type': 'FUT', 'last_price': 'n/a'},
+            'PE1': {'instrument_type': 'PE', 'last_price': 20, 'oi': 300, 'volume': 3},
+        }
+        stats = checker.get_statistics(options_data)
+
+        assert (stats['call_count'], stats['put_count'], stats['total_count']) == (1, 1, 3)
+        assert stats['pcr'] == 3.0
+        assert stats['put_volume_total'] == 3.0
+
     def test_get_statistics_calls_only(self, checker):
         """Test statistics with calls only."""
         options_data = {
@@ -385,5 +536,21 @@ class TestDataQualityChecker:
         assert 'call_price_avg' not in stats
 
 
+
+def test_import_does_not_load_numba():
+    """Test importing the module leaves Numba unloaded; the first validation resolves the kernel."""
+    code = (
+        "import sys\n"
+        "from src.utils import data_quality as dq\n"
+        "assert 'numba' not in sys.modules, 'numba imported at module load'\n"
+        "assert dq._ARRAY_KERNEL is None\n"
+        f"row = {_option_row()!r}\n"
+        "assert list(dq.DataQualityChecker().validate_options_data({'X': row})[0]) == ['X']\n"
+        "assert dq._ARRAY_KERNEL is not None\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    proc = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])